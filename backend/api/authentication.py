@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+# How long a token -> user lookup is trusted before the database is checked again (seconds)
+AUTH_TOKEN_CACHE_TIMEOUT = getattr(settings, "AUTH_TOKEN_CACHE_TIMEOUT", 60)
+
+# Caches private to one process: an invalidation there never reaches the other workers
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def token_cache_key(key: str) -> str:
+    return f"auth-token:{key}"
+
+
+def token_cache_enabled() -> bool:
+    """
+    Lookups are only cached in a cache shared by all workers, unless
+    AUTH_TOKEN_CACHE_ENABLED is set to True or False.
+    """
+    enabled = getattr(settings, "AUTH_TOKEN_CACHE_ENABLED", None)
+    if enabled is None:
+        enabled = settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES
+    return enabled
+
+
+def forget_tokens(*keys):
+    """ Drops cached authentication lookups, e.g. after logout or a profile change. """
+    cache.delete_many([token_cache_key(key) for key in keys if key])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that keeps the token, its user and the user's student profile
+    in the cache, so warm requests (and permission checks on `request.user.student`)
+    don't touch the database.
+
+    Entries are dropped by the signals in `api.signals` whenever the token is deleted
+    or the user/student row is saved, and otherwise expire after a short TTL. With a
+    per-process cache (see token_cache_enabled) every request reads the database, so a
+    logout or role change on one worker applies on all of them at once.
+    """
+
+    def authenticate_credentials(self, key):
+        use_cache = token_cache_enabled()
+        cache_key = token_cache_key(key)
+        token = cache.get(cache_key) if use_cache else None
+
+        if token is None:
+            model = self.get_model()
+            try:
+                # The password hash is left out so it never ends up in the cache
+                token = model.objects.select_related('user', 'user__student').defer('user__password').get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            if use_cache:
+                cache.set(cache_key, token, AUTH_TOKEN_CACHE_TIMEOUT)
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
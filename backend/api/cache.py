@@ -0,0 +1,146 @@
+import hashlib
+import json
+import uuid
+from typing import Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+# How long an image existence/URL lookup is trusted before storage is checked again (seconds)
+IMAGE_URL_CACHE_TIMEOUT = getattr(settings, "IMAGE_URL_CACHE_TIMEOUT", 60 * 60)
+# Stored for images that are known to be missing, so they aren't re-checked on every request
+MISSING_IMAGE = ""
+
+
+def image_cache_key(name: str) -> str:
+    return f"image-url:{name}"
+
+
+def cached_image_url(image) -> Optional[str]:
+    """
+    Returns the storage URL of an image field file, or None if the file does not exist.
+
+    The lookup is served from the cache when possible; storage is only hit on a
+    miss (e.g. after a restart or once the TTL expires).
+    """
+    if not image or not image.name:
+        return None
+    return cached_storage_urls(image.storage, [image.name])[image.name]
+
+
+def cached_storage_urls(storage, names) -> Dict[str, Optional[str]]:
+    """ Like cached_image_url(), for several files of one storage with a single cache round trip. """
+    keys = {image_cache_key(name): name for name in names}
+    urls = {keys[key]: url for key, url in cache.get_many(keys).items()}
+
+    missing = {}
+    for key, name in keys.items():
+        if name not in urls:
+            try:
+                urls[name] = storage.url(name) if storage.exists(name) else MISSING_IMAGE
+            except Exception:
+                urls[name] = MISSING_IMAGE
+            missing[key] = urls[name]
+    if missing:
+        cache.set_many(missing, IMAGE_URL_CACHE_TIMEOUT)
+
+    return {name: url or None for name, url in urls.items()}
+
+
+def remember_image(image):
+    """ Marks a freshly uploaded image as existing. """
+    if image and image.name:
+        cache.set(image_cache_key(image.name), image.url, IMAGE_URL_CACHE_TIMEOUT)
+
+
+def forget_image(name: Optional[str]):
+    """ Drops the cached lookup for an image that was deleted or replaced. """
+    if name:
+        cache.delete(image_cache_key(name))
+
+
+def _version(key: str) -> str:
+    # A missing version (never set, evicted or bumped) is replaced by a fresh random one,
+    # so anything cached under an older version can never be served again.
+    return cache.get_or_set(key, lambda: uuid.uuid4().hex, None)
+
+
+def meeting_version(meeting_id) -> str:
+    """ Content version of a meeting and its attendance records. """
+    return _version(f"meeting-version:{meeting_id}")
+
+
+def bump_meeting_version(meeting_id):
+    cache.delete(f"meeting-version:{meeting_id}")
+
+
+def content_version(group: str) -> str:
+    """ Content version of a group of models, e.g. "events" or "blogs". """
+    return _version(f"{group}-version")
+
+
+def bump_content_version(group: str):
+    cache.delete(f"{group}-version")
+
+
+def members_version() -> str:
+    """ Content version of user and student profiles (names, roll numbers, clubs). """
+    return content_version("members")
+
+
+def bump_members_version():
+    bump_content_version("members")
+
+
+# How long a response's data is kept; entries are also dropped as soon as their data changes
+RESPONSE_CACHE_TIMEOUT = getattr(settings, "RESPONSE_CACHE_TIMEOUT", 60 * 5)
+
+
+class CachedResponseMixin:
+    """
+    Caches the serialized data of a list endpoint and answers conditional requests.
+
+    Views list the content groups they read in `response_cache_groups`; the signals in
+    `api.signals` bump a group's version whenever one of its models changes, which
+    orphans every response built from the old data. Cached responses carry an ETag and
+    Last-Modified, so clients revalidating an unchanged list get a 304. Hits are
+    returned as a regular `Response`, so content negotiation and rendering still apply.
+
+    The cache backend is whatever `CACHES['default']` is (locmem unless REDIS_URL is set).
+    """
+    response_cache_groups = ()
+
+    def get_response_cache_key(self, request) -> str:
+        versions = ":".join(content_version(group) for group in self.response_cache_groups)
+        # The absolute URL covers query params and the host used in absolute media URLs
+        digest = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        return f"response:{type(self).__name__}:{digest}:{versions}"
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            content = JSONRenderer().render(response.data)
+            entry = {
+                # Plain JSON data: serializer output (ReturnList) keeps a reference to its serializer
+                'data': json.loads(content),
+                'etag': quote_etag(hashlib.md5(content).hexdigest()),
+                'last_modified': int(timezone.now().timestamp()),
+            }
+            cache.set(key, entry, RESPONSE_CACHE_TIMEOUT)
+
+        response = get_conditional_response(
+            request, etag=entry['etag'], last_modified=entry['last_modified']
+        )
+        if response is None:
+            response = Response(entry['data'])
+        response['ETag'] = entry['etag']
+        response['Last-Modified'] = http_date(entry['last_modified'])
+        return response
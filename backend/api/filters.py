@@ -0,0 +1,27 @@
+from rest_framework.filters import BaseFilterBackend
+
+
+class ApplicationSearchFilter(BaseFilterBackend):
+    """
+    Full-text search over recruitment applications through `?search=`, ranked
+    best match first (see RecruitmentApplicationQuerySet.search).
+    """
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+        return queryset.search(terms)
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': (
+                'Words to look for in names, email, registration number, skills and answers. '
+                'Supports "quoted phrases", OR and -excluded words.'
+            ),
+            'schema': {'type': 'string'},
+        }]
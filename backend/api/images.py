@@ -0,0 +1,197 @@
+import logging
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from typing import Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+from api.cache import IMAGE_URL_CACHE_TIMEOUT, MISSING_IMAGE, bump_content_version, cached_image_url, \
+    cached_storage_urls, forget_image, image_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Widths (px) of the WebP variants generated for every uploaded image
+IMAGE_VARIANT_WIDTHS = tuple(sorted(getattr(settings, "IMAGE_VARIANT_WIDTHS", (320, 640, 1280))))
+IMAGE_VARIANT_QUALITY = getattr(settings, "IMAGE_VARIANT_QUALITY", 80)
+# Resizing and WebP encoding release the GIL, so a few threads keep up with uploads
+IMAGE_VARIANT_WORKERS = getattr(settings, "IMAGE_VARIANT_WORKERS", 2)
+
+# Files removed per pass of the deletion worker
+FILE_DELETION_BATCH_SIZE = getattr(settings, "FILE_DELETION_BATCH_SIZE", 100)
+
+VARIANT_SUFFIX = re.compile(r'\.\d+w\.webp$')
+
+_executor = None
+
+
+def variant_name(name: str, width: int) -> str:
+    """
+    events/3/poster.jpg -> events/3/poster.jpg.640w.webp
+
+    The original extension is kept, so poster.jpg and poster.png never share variants.
+    """
+    return f"{name}.{width}w.webp"
+
+
+def variant_names(name: str) -> Dict[int, str]:
+    return {width: variant_name(name, width) for width in IMAGE_VARIANT_WIDTHS}
+
+
+def generate_variants(storage, name: str) -> Dict[int, str]:
+    """
+    Writes a downscaled WebP copy of an image for every configured width narrower
+    than the original, and records in the image cache which variants exist.
+    """
+    generated = {}
+    with storage.open(name) as f, Image.open(f) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if image.mode in ('LA', 'PA', 'P') else 'RGB')
+
+        for width, target in variant_names(name).items():
+            if width >= image.width:
+                # Never upscale; remember the variant as missing so it isn't looked up again
+                cache.set(image_cache_key(target), MISSING_IMAGE, IMAGE_URL_CACHE_TIMEOUT)
+                continue
+
+            buffer = BytesIO()
+            height = max(round(image.height * width / image.width), 1)
+            image.resize((width, height), Image.LANCZOS).save(buffer, 'WEBP', quality=IMAGE_VARIANT_QUALITY)
+            if storage.exists(target):
+                storage.delete(target)
+            saved = storage.save(target, ContentFile(buffer.getvalue()))
+            cache.set(image_cache_key(saved), storage.url(saved), IMAGE_URL_CACHE_TIMEOUT)
+            generated[width] = saved
+
+    return generated
+
+
+def delete_image_files(storage, name: str) -> int:
+    """ Deletes an image and its variants from storage. Returns the number of bytes freed. """
+    freed = 0
+    for target in [name, *variant_names(name).values()]:
+        if storage.exists(target):
+            freed += storage.size(target)
+            storage.delete(target)
+        forget_image(target)
+    return freed
+
+
+def original_name(name: str) -> str:
+    """ Name of the image a file belongs to: poster.jpg.640w.webp -> poster.jpg; originals are unchanged """
+    return VARIANT_SUFFIX.sub('', name)
+
+
+class FileDeletionQueue:
+    """
+    Deletes image files (with their variants) in the background, in batches.
+
+    Files are only queued once the transaction that deleted their rows commits, so
+    a rollback never loses a file. The queue lives in memory; anything lost in a
+    crash is found later by the `reconcile_blog_images` command.
+    """
+
+    def __init__(self, batch_size=FILE_DELETION_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.worker = None
+
+    def put(self, storage, name: str):
+        with self.lock:
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self.run, name='file-deletion', daemon=True)
+                self.worker.start()
+        self.queue.put((storage, name))
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            for storage, name in batch:
+                try:
+                    delete_image_files(storage, name)
+                except Exception:
+                    logger.exception("Deleting %s failed", name)
+                finally:
+                    self.queue.task_done()
+
+    def join(self):
+        """ Blocks until every queued file has been handled. """
+        self.queue.join()
+
+
+file_deletion_queue = FileDeletionQueue()
+
+
+def delete_file_on_commit(image):
+    """ Queues an image file for deletion once the current transaction commits. """
+    if image and image.name:
+        transaction.on_commit(partial(file_deletion_queue.put, image.storage, image.name))
+
+
+def _generate(storage, name: str, group: Optional[str]):
+    try:
+        generate_variants(storage, name)
+    except Exception:
+        logger.exception("Generating variants of %s failed", name)
+        return
+    if group:
+        # Cached list responses were rendered without the new variants
+        bump_content_version(group)
+
+
+def variant_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=IMAGE_VARIANT_WORKERS, thread_name_prefix='image-variants')
+    return _executor
+
+
+def schedule_variants(image, group: Optional[str] = None):
+    """
+    Generates the variants of a freshly uploaded image in the worker pool once the
+    surrounding transaction commits, keeping resizing off the request path.
+    `group` is the content group (see CachedResponseMixin) to refresh afterwards.
+
+    Set IMAGE_VARIANTS_ASYNC = False to generate them inline instead (e.g. in tests).
+    """
+    if not image or not image.name:
+        return
+    storage, name = image.storage, image.name
+    # Until the worker is done, serializers shouldn't go to storage looking for the variants
+    cache.set_many({image_cache_key(target): MISSING_IMAGE for target in variant_names(name).values()},
+                   IMAGE_URL_CACHE_TIMEOUT)
+    if getattr(settings, "IMAGE_VARIANTS_ASYNC", True):
+        transaction.on_commit(lambda: variant_executor().submit(_generate, storage, name, group))
+    else:
+        _generate(storage, name, group)
+
+
+def image_srcset(image, request=None) -> Dict[str, str]:
+    """
+    Returns the generated variants of an image as a srcset-style map, e.g.
+    {"320w": url, "640w": url}. Variants that don't exist (yet) are left out.
+    """
+    # Variants of a missing original aren't looked up at all
+    if not cached_image_url(image):
+        return {}
+
+    names = variant_names(image.name)
+    urls = cached_storage_urls(image.storage, names.values())
+    srcset = {}
+    for width, name in names.items():
+        url = urls[name]
+        if url:
+            srcset[f"{width}w"] = request.build_absolute_uri(url) if request else url
+    return srcset
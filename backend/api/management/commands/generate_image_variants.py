@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from api.cache import bump_content_version
+from api.images import generate_variants
+from api.models import Event, BlogImage, InlineImage, Student
+
+# (model, image field, content group refreshed afterwards)
+IMAGE_FIELDS = [
+    (Event, 'image', 'events'),
+    (BlogImage, 'image', 'blogs'),
+    (InlineImage, 'image', None),
+    (Student, 'profile_pic', 'members'),
+]
+
+
+class Command(BaseCommand):
+    help = "Generates the resized WebP variants of images uploaded before variants existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help="Number of images processed in parallel.")
+
+    def handle(self, *args, **options):
+        generated = failed = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            for model, field_name, group in IMAGE_FIELDS:
+                storage = model._meta.get_field(field_name).storage
+                names = (
+                    model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                    .values_list(field_name, flat=True).distinct().iterator()
+                )
+                futures = {name: executor.submit(generate_variants, storage, name) for name in names}
+                for name, future in futures.items():
+                    try:
+                        generated += len(future.result())
+                    except Exception as e:
+                        failed += 1
+                        self.stderr.write(f"{model.__name__} {name}: {e}")
+                if group:
+                    bump_content_version(group)
+
+        self.stdout.write(self.style.SUCCESS(f"Generated {generated} variant(s); {failed} image(s) failed."))
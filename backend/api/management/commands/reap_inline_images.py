@@ -0,0 +1,86 @@
+import os
+import re
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from api.images import delete_image_files
+from api.models import Blog, InlineImage
+
+# Inline images younger than this are kept even if unreferenced: their blog may still be a draft
+INLINE_IMAGE_GRACE_PERIOD = getattr(settings, "INLINE_IMAGE_GRACE_PERIOD", timedelta(hours=24))
+
+# Matches both relative (/media/temp_inline/x.jpg) and absolute URLs, including variant URLs
+INLINE_REFERENCE = re.compile(r'temp_inline/([\w-]+)[\w.-]*')
+
+
+def referenced_inline_images() -> set:
+    """
+    Builds the index of inline images referenced by any blog, as the uuid part of
+    their file names (which variants share with their original).
+    """
+    references = set()
+    contents = Blog.objects.filter(content__contains='temp_inline/').values_list('content', flat=True)
+    for content in contents.iterator():
+        references.update(INLINE_REFERENCE.findall(content))
+    return references
+
+
+def inline_image_key(name: str) -> str:
+    """ temp_inline/<uuid>.jpg -> <uuid> """
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+class Command(BaseCommand):
+    help = "Deletes inline blog images that no blog references once they are older than the grace period."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=float,
+                            default=INLINE_IMAGE_GRACE_PERIOD.total_seconds() / 3600,
+                            help="Only images uploaded longer ago than this are deleted.")
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Number of images deleted per batch.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Report what would be deleted without deleting anything.")
+        parser.add_argument('--every', type=float, metavar='SECONDS',
+                            help="Keep running, reaping again every SECONDS.")
+
+    def handle(self, *args, **options):
+        while True:
+            deleted, freed = self.reap(options['grace_hours'], options['batch_size'], options['dry_run'])
+            verb = "Would delete" if options['dry_run'] else "Deleted"
+            self.stdout.write(self.style.SUCCESS(
+                f"{verb} {deleted} unreferenced inline image(s), reclaiming {freed} bytes."
+            ))
+            if not options['every']:
+                break
+            time.sleep(options['every'])
+
+    def reap(self, grace_hours, batch_size, dry_run):
+        references = referenced_inline_images()
+        cutoff = timezone.now() - timedelta(hours=grace_hours)
+        candidates = InlineImage.objects.filter(uploaded_at__lt=cutoff).order_by('id')
+
+        deleted = freed = 0
+        last_id = 0
+        while True:
+            # Keyset batches, so deleting rows doesn't shift the next batch
+            batch = list(candidates.filter(id__gt=last_id).values_list('id', 'image')[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            orphans = [(pk, name) for pk, name in batch if inline_image_key(name) not in references]
+            if not orphans:
+                continue
+
+            storage = InlineImage._meta.get_field('image').storage
+            if dry_run:
+                freed += sum(storage.size(name) for _, name in orphans if storage.exists(name))
+            else:
+                InlineImage.objects.filter(id__in=[pk for pk, _ in orphans]).delete()
+                freed += sum(delete_image_files(storage, name) for _, name in orphans)
+            deleted += len(orphans)
+
+        return deleted, freed
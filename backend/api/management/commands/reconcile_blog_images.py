@@ -0,0 +1,65 @@
+import posixpath
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from api.images import original_name
+from api.models import BlogImage
+
+BLOG_IMAGE_ROOT = 'blog_images'
+
+
+def walk(storage, path):
+    """ Yields the names of all files below a storage directory. """
+    try:
+        directories, files = storage.listdir(path)
+    except FileNotFoundError:
+        return
+    for file in files:
+        yield posixpath.join(path, file)
+    for directory in directories:
+        yield from walk(storage, posixpath.join(path, directory))
+
+
+class Command(BaseCommand):
+    help = "Finds blog image files (and variants) in storage that no BlogImage row owns, and deletes them."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-minutes', type=float, default=60,
+                            help="Files modified more recently are skipped; their rows may not be committed yet.")
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Number of orphaned files deleted per batch.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only report orphaned files.")
+
+    def handle(self, *args, **options):
+        storage = BlogImage._meta.get_field('image').storage
+        owned = set(BlogImage.objects.values_list('image', flat=True).iterator())
+        cutoff = timezone.now() - timedelta(minutes=options['grace_minutes'])
+
+        orphans = []
+        found = freed = 0
+        for name in walk(storage, BLOG_IMAGE_ROOT):
+            if original_name(name) in owned or storage.get_modified_time(name) > cutoff:
+                continue
+            found += 1
+            if options['dry_run']:
+                self.stdout.write(name)
+                freed += storage.size(name)
+                continue
+            orphans.append(name)
+            if len(orphans) >= options['batch_size']:
+                freed += self.delete(storage, orphans)
+                orphans = []
+        freed += self.delete(storage, orphans)
+
+        verb = "Found" if options['dry_run'] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {found} orphaned file(s), {freed} bytes."))
+
+    def delete(self, storage, names):
+        # Variants are listed as files of their own, so only delete what was listed
+        freed = 0
+        for name in names:
+            if storage.exists(name):
+                freed += storage.size(name)
+                storage.delete(name)
+        return freed
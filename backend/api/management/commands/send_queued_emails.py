@@ -0,0 +1,110 @@
+import time
+from datetime import timedelta
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from api.models import OutgoingEmail, EmailStatus
+
+
+class Command(BaseCommand):
+    help = "Delivers queued emails from the outbox in batches, retrying failures with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50,
+                            help="Maximum number of emails sent over one connection.")
+        parser.add_argument('--max-attempts', type=int, default=5,
+                            help="Attempts before an email is marked as failed.")
+        parser.add_argument('--retry-delay', type=int, default=60,
+                            help="Base delay in seconds before a retry; doubled on every attempt.")
+        parser.add_argument('--claim-timeout', type=int, default=300,
+                            help="Seconds after which emails claimed by a worker that never reported back "
+                                 "are picked up again.")
+        parser.add_argument('--loop', action='store_true',
+                            help="Keep polling the outbox instead of exiting once it is drained.")
+        parser.add_argument('--poll-interval', type=float, default=5,
+                            help="Seconds to sleep between polls when --loop is given.")
+
+    def handle(self, *args, **options):
+        sent = failed = 0
+        while True:
+            batch_sent, batch_failed = self.send_batch(
+                options['batch_size'], options['max_attempts'], options['retry_delay'], options['claim_timeout']
+            )
+            sent += batch_sent
+            failed += batch_failed
+            if batch_sent + batch_failed == 0:
+                if not options['loop']:
+                    break
+                time.sleep(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} email(s), {failed} failed attempt(s)."))
+
+    def claim(self, batch_size, claim_timeout):
+        """
+        Marks up to `batch_size` due emails as being sent and commits, so no row
+        lock or transaction is held while talking to the mail server. SKIP LOCKED
+        lets several workers claim disjoint batches.
+        """
+        with transaction.atomic():
+            emails = list(OutgoingEmail.objects.due().select_for_update(skip_locked=True)[:batch_size])
+            lease = timezone.now() + timedelta(seconds=claim_timeout)
+            for email in emails:
+                email.status = EmailStatus.SENDING
+                email.next_attempt_at = lease
+                email.attempts += 1
+            OutgoingEmail.objects.bulk_update(emails, ['status', 'next_attempt_at', 'attempts'])
+        return emails
+
+    def send_batch(self, batch_size, max_attempts, retry_delay, claim_timeout=300):
+        """ Claims a batch of due emails, sends them over a single connection and records the outcomes. """
+        emails = self.claim(batch_size, claim_timeout)
+        if not emails:
+            return 0, 0
+
+        errors = {}
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as e:
+            # Nothing can be sent; every claimed email counts as a failed attempt
+            errors = {email.pk: e for email in emails}
+        else:
+            try:
+                for email in emails:
+                    message = EmailMessage(
+                        email.subject, email.message, email.from_email, email.recipients,
+                        connection=connection,
+                    )
+                    try:
+                        message.send(fail_silently=False)
+                    except Exception as e:
+                        errors[email.pk] = e
+            finally:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+
+        now = timezone.now()
+        for email in emails:
+            error = errors.get(email.pk)
+            if error is None:
+                email.status = EmailStatus.SENT
+                email.sent_at = now
+                email.last_error = ''
+            else:
+                email.last_error = str(error)
+                if email.attempts >= max_attempts:
+                    email.status = EmailStatus.FAILED
+                else:
+                    email.status = EmailStatus.PENDING
+                    email.next_attempt_at = now + timedelta(seconds=retry_delay * 2 ** (email.attempts - 1))
+            if email.status != EmailStatus.PENDING:
+                # Bodies carry OTPs and initial passwords; once delivered or given up, nothing reads them
+                email.message = ''
+
+        OutgoingEmail.objects.bulk_update(
+            emails, ['status', 'message', 'last_error', 'next_attempt_at', 'sent_at']
+        )
+        return len(emails) - len(errors), len(errors)
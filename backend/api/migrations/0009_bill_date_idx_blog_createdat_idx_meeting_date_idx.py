@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0008_eventregistration_eventparticipant"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bill",
+            index=models.Index(fields=["date"], name="api_bill_date_5936c7_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="blog",
+            index=models.Index(fields=["createdAt"], name="api_blog_created_8f43ef_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(fields=["date"], name="api_meeting_date_a17e52_idx"),
+        ),
+    ]
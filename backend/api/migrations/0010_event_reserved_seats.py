@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:05
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_reserved_seats(apps, schema_editor):
+    Event = apps.get_model("api", "Event")
+    EventRegistration = apps.get_model("api", "EventRegistration")
+    active_registrations = (
+        EventRegistration.objects.filter(event=OuterRef("pk"))
+        .exclude(status="CANCELLED")
+        .order_by()
+        .values("event")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    Event.objects.update(reserved_seats=Coalesce(Subquery(active_registrations), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_bill_date_idx_blog_createdat_idx_meeting_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="reserved_seats",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_reserved_seats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_event_reserved_seats"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="student",
+            name="roll_no",
+            field=models.CharField(db_index=True, default="", max_length=20),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0012_outgoingemail"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recruitmentapplication",
+            index=models.Index(
+                fields=["recruitment_session", "status", "id"], name="api_recruit_recruit_be22f0_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recruitmentapplication",
+            index=models.Index(fields=["status", "id"], name="api_recruit_status_1dbf45_idx"),
+        ),
+        migrations.AlterField(
+            model_name="recruitmentapplication",
+            name="recruitment_session",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="applications",
+                to="api.recruitmentsession",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rolepreferences",
+            index=models.Index(fields=["preferred_role", "application"], name="api_rolepre_preferr_326aa8_idx"),
+        ),
+    ]
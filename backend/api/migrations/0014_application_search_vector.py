@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+from django.contrib.postgres.search import SearchVector
+from django.db.models import OuterRef, Subquery
+
+
+def index_applications(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    RecruitmentApplication = apps.get_model("api", "RecruitmentApplication")
+    # A frozen copy of api.models.recruitment.application_search_vector() as of this migration
+    vector = (
+        SearchVector(
+            "personal_info__first_name", "personal_info__last_name", "personal_info__email",
+            "academic_info__reg_no", weight="A", config="english",
+        )
+        + SearchVector("academic_info__skills", weight="B", config="english")
+        + SearchVector(
+            "role_preferences__join_purpose", "role_preferences__previous_experience",
+            weight="C", config="english",
+        )
+    )
+    vectors = (
+        RecruitmentApplication.objects.filter(pk=OuterRef("pk")).order_by()
+        .annotate(vector=vector).values("vector")
+    )
+    RecruitmentApplication.objects.update(search_vector=Subquery(vectors))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_recruitment_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recruitmentapplication",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(index_applications, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="recruitmentapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="api_recruit_search__e2b420_gin"
+            ),
+        ),
+    ]
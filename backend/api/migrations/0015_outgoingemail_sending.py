@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_application_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outgoingemail',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'pending'), ('SENDING', 'sending'), ('SENT', 'sent'), ('FAILED', 'failed')], default='PENDING', max_length=10),
+        ),
+    ]
@@ -1,6 +1,7 @@
-from .user import User, Student
+from .user import User, Student, UserRole
 from .bill import Bill
 from .blog import Blog, BlogImage, InlineImage
 from .event import Event, EventType, EventRegistration, EventParticipant, RegistrationType, RegistrationStatus
 from .meeting import Meeting, MeetingAttendance
 from .recruitment import (RecruitmentSession, RecruitmentApplication, PersonalInfo, AcademicInfo, RolePreferences, ApplicationStatus, Role)
+from .email import OutgoingEmail, EmailStatus
@@ -12,6 +12,11 @@ class Bill(models.Model):
     date = models.DateField(default=date.today)
     image = models.ImageField(upload_to=bill_image_upload_path)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
     def save(self, *args, **kwargs):
         if self.id is None:
             saved_image = self.image
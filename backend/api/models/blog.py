@@ -1,6 +1,11 @@
 import os
 import uuid
-from django.db import models
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from django.conf import settings
+from django.db import models, transaction
+from api.cache import bump_content_version
+from api.images import schedule_variants
 from api.models import User
 
 
@@ -8,6 +13,9 @@ def blog_image_upload_path(instance, filename):
     # Store images under: media/blog_images/<blog_uuid>/<filename>
     return f'blog_images/{instance.blog.id}/{filename}'
 
+# Files of one post are written to storage concurrently by this many threads
+BLOG_IMAGE_UPLOAD_WORKERS = getattr(settings, "BLOG_IMAGE_UPLOAD_WORKERS", 4)
+
 class Blog(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
@@ -15,14 +23,64 @@ class Blog(models.Model):
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['createdAt']),
+        ]
+
+
+class BlogImageQuerySet(models.QuerySet):
+    def attach(self, blog, files):
+        """
+        Adds uploaded files to a blog: the files are written to storage by a thread
+        pool, then all rows are inserted with a single bulk_create. If the insert
+        fails, the files written for it are removed again.
+        """
+        if not files:
+            return []
+
+        field = self.model._meta.get_field('image')
+        images = [self.model(blog=blog) for _ in files]
+
+        def write(image, upload):
+            name = field.generate_filename(image, upload.name)
+            return field.storage.save(name, upload, max_length=field.max_length)
+
+        with ThreadPoolExecutor(max_workers=min(len(files), BLOG_IMAGE_UPLOAD_WORKERS)) as executor:
+            futures = [executor.submit(write, image, upload) for image, upload in zip(images, files)]
+        written = [future.result() for future in futures if future.exception() is None]
+        try:
+            for image, future in zip(images, futures):
+                image.image = future.result()  # raises the first failed write
+            images = self.bulk_create(images)
+        except Exception:
+            for name in written:
+                field.storage.delete(name)
+            raise
+
+        # bulk_create skips save() and post_save, which normally take care of these
+        for image in images:
+            schedule_variants(image.image, 'blogs')
+        transaction.on_commit(partial(bump_content_version, 'blogs'))
+        return images
+
 
 class BlogImage(models.Model):
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to=blog_image_upload_path)
 
+    objects = BlogImageQuerySet.as_manager()
+
     def __str__(self):
         return f'Image for blog {self.blog.id}'
 
+    def save(self, *args, **kwargs):
+        # An uncommitted file means a new image is being uploaded with this save
+        uploaded = bool(self.image) and not self.image._committed
+        super().save(*args, **kwargs)
+        if uploaded:
+            schedule_variants(self.image, 'blogs')
+
 def temp_inline_upload_path(instance, filename):
     """
     Store inline images in temp_inline/ with a unique filename
@@ -34,4 +92,10 @@ def temp_inline_upload_path(instance, filename):
 
 class InlineImage(models.Model):
     image = models.ImageField(upload_to=temp_inline_upload_path)
-    uploaded_at = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    uploaded_at = models.DateTimeField(auto_now_add=True)
+
+    def save(self, *args, **kwargs):
+        uploaded = bool(self.image) and not self.image._committed
+        super().save(*args, **kwargs)
+        if uploaded:
+            schedule_variants(self.image)
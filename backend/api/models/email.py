@@ -0,0 +1,51 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.utils import timezone
+
+
+class EmailStatus(models.TextChoices):
+    PENDING = 'PENDING', 'pending'
+    # Claimed by a worker until next_attempt_at; claimed again if the worker dies
+    SENDING = 'SENDING', 'sending'
+    SENT = 'SENT', 'sent'
+    FAILED = 'FAILED', 'failed'
+
+
+class OutgoingEmailQuerySet(models.QuerySet):
+    def due(self):
+        """
+        Pending emails whose next delivery attempt is not in the future, plus claimed
+        emails whose worker never reported back, oldest first.
+        """
+        return self.filter(
+            status__in=[EmailStatus.PENDING, EmailStatus.SENDING],
+            next_attempt_at__lte=timezone.now(),
+        ).order_by('next_attempt_at', 'id')
+
+
+class OutgoingEmail(models.Model):
+    """
+    Outbox entry for an email that is sent in the background by the
+    `send_queued_emails` management command instead of inside the request.
+    The message is blanked once the email is sent or given up on.
+    """
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    from_email = models.EmailField()
+    recipients = ArrayField(models.EmailField())
+    status = models.CharField(max_length=10, choices=EmailStatus.choices, default=EmailStatus.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    objects = OutgoingEmailQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
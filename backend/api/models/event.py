@@ -1,8 +1,12 @@
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 from datetime import date
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import RegexValidator
+from api.cache import remember_image, forget_image
+from api.images import schedule_variants
 
 
 def event_image_upload_path(instance, filename):
@@ -37,6 +41,32 @@ class EventType(models.Model):
         return self.type
 
 
+class EventQuerySet(models.QuerySet):
+    def with_registration_stats(self):
+        """
+        Annotate each event with its active (non-cancelled) registration count
+        and remaining seats, so serializers don't issue a COUNT per row.
+        """
+        return self.annotate(
+            active_registration_count=F('reserved_seats'),
+            seats_remaining=Greatest(F('total_seats') - F('reserved_seats'), Value(0)),
+        )
+
+    def reserve_seat(self, event_id):
+        """
+        Takes one seat of an event with a single conditional UPDATE. The row lock
+        taken by the UPDATE serializes concurrent reservations, so an event can
+        never be overbooked. Returns False if the event is full.
+        """
+        return self.filter(pk=event_id, reserved_seats__lt=F('total_seats')).update(
+            reserved_seats=F('reserved_seats') + 1
+        ) == 1
+
+    def release_seat(self, event_id):
+        """ Gives back a seat taken by reserve_seat(). """
+        self.filter(pk=event_id, reserved_seats__gt=0).update(reserved_seats=F('reserved_seats') - 1)
+
+
 class Event(models.Model):
     event_type = models.ForeignKey(EventType, on_delete=models.PROTECT, related_name='events', null=True)
 
@@ -50,6 +80,8 @@ class Event(models.Model):
     image = models.ImageField(upload_to='events/', default=f'{settings.MEDIA_ROOT}/events/default.png', blank=True,
                               null=True)
     total_seats = models.PositiveIntegerField(default=0)
+    # Number of active (non-cancelled) registrations, maintained by reserve_seat()/release_seat()
+    reserved_seats = models.PositiveIntegerField(default=0)
     tags = ArrayField(
         models.CharField(
             max_length=25,
@@ -69,6 +101,8 @@ class Event(models.Model):
         blank=True,
     )
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ['-date']
         indexes = [
@@ -79,6 +113,27 @@ class Event(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # An uncommitted file means a new image is being uploaded with this save
+        uploaded = bool(self.image) and not self.image._committed
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # reserved_seats is only written by reserve_seat()/release_seat(); writing back the
+            # value loaded with this instance would undo reservations made since then
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'reserved_seats'
+            ]
+        super().save(*args, **kwargs)
+        if uploaded:
+            remember_image(self.image)
+            schedule_variants(self.image, 'events')
+
+    def delete(self, *args, **kwargs):
+        image_name = self.image.name if self.image else None
+        result = super().delete(*args, **kwargs)
+        forget_image(image_name)
+        return result
+
 
 class EventRegistration(models.Model):
     event = models.ForeignKey(
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Count, Q
 from datetime import date
 from api.models import User
 from api.utils import current_time
@@ -18,8 +19,29 @@ class Meeting(models.Model):
     agenda = models.TextField(null=True, blank=True)
     highlights = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+
+class MeetingAttendanceQuerySet(models.QuerySet):
+    def status_counts(self):
+        """
+        Counts the records per attendance status, and in total, with a single
+        conditional aggregate query.
+        """
+        return self.aggregate(
+            present=Count('id', filter=Q(status=AttendanceStatus.PRESENT)),
+            absent=Count('id', filter=Q(status=AttendanceStatus.ABSENT)),
+            leave=Count('id', filter=Q(status=AttendanceStatus.LEAVE)),
+            total=Count('id'),
+        )
+
 
 class MeetingAttendance(models.Model):
     meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name='attendance')
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='attending_student')
-    status = models.CharField(max_length=10, choices=AttendanceStatus.choices)
\ No newline at end of file
+    status = models.CharField(max_length=10, choices=AttendanceStatus.choices)
+
+    objects = MeetingAttendanceQuerySet.as_manager()
@@ -1,7 +1,10 @@
-from django.db import models
+from django.db import connection, models
+from django.db.models import Count, F, OuterRef, Q, Subquery
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator, EmailValidator
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
 from datetime import date
 
 #  ENUMS/CHOICES
@@ -73,22 +76,137 @@ class RecruitmentSession(models.Model):
         self.full_clean()
         super().save(*args, **kwargs)
 
+    def application_stats(self):
+        """
+        Breaks the session's applications down by status, program, semester,
+        preferred role and skill, with one grouped query per breakdown.
+        """
+        def grouped(queryset, field, keys=()):
+            counts = dict.fromkeys(keys, 0)
+            counts.update(queryset.values_list(field).annotate(count=Count('*')).order_by(field))
+            return counts
+
+        applications = self.applications.order_by()
+        by_status = grouped(applications, 'status', ApplicationStatus.values)
+
+        academic = AcademicInfo.objects.filter(application__recruitment_session=self).order_by()
+        preferences = RolePreferences.objects.filter(application__recruitment_session=self).order_by()
+
+        # Skills are free text in an array column: unnest them and group case-insensitively
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT lower(trim(skill)) AS name, COUNT(*) AS count
+                FROM api_academicinfo
+                JOIN api_recruitmentapplication ON api_recruitmentapplication.id = api_academicinfo.application_id
+                CROSS JOIN unnest(api_academicinfo.skills) AS skill
+                WHERE api_recruitmentapplication.recruitment_session_id = %s AND trim(skill) <> ''
+                GROUP BY 1
+                ORDER BY count DESC, name
+                """,
+                [self.pk],
+            )
+            skills = [{'skill': name, 'count': count} for name, count in cursor.fetchall()]
+
+        return {
+            'total': sum(by_status.values()),
+            'by_status': by_status,
+            'by_program': grouped(academic, 'program', Program.values),
+            'by_semester': grouped(academic, 'current_semester'),
+            'by_preferred_role': grouped(preferences, 'preferred_role', Role.values),
+            'skills': skills,
+        }
+
+
+# Text search configuration of the application search vectors
+SEARCH_CONFIG = 'english'
+
+# Text fields matched by the fallback search on databases without full-text search
+FALLBACK_SEARCH_FIELDS = [
+    'personal_info__first_name', 'personal_info__last_name', 'personal_info__email',
+    'academic_info__reg_no', 'role_preferences__join_purpose', 'role_preferences__previous_experience',
+]
+
+
+def application_search_vector():
+    """
+    The searchable text of an application, spread over its 1-to-1 records:
+    identity first (A), then skills (B), then the free-text answers (C).
+    """
+    return (
+        SearchVector(
+            'personal_info__first_name', 'personal_info__last_name', 'personal_info__email',
+            'academic_info__reg_no', weight='A', config=SEARCH_CONFIG,
+        )
+        + SearchVector('academic_info__skills', weight='B', config=SEARCH_CONFIG)
+        + SearchVector(
+            'role_preferences__join_purpose', 'role_preferences__previous_experience',
+            weight='C', config=SEARCH_CONFIG,
+        )
+    )
+
+
+class RecruitmentApplicationQuerySet(models.QuerySet):
+    def update_search_vectors(self):
+        """ Recomputes the stored search vector of these applications in one UPDATE. """
+        if connection.vendor != 'postgresql':
+            return 0
+        vectors = (
+            RecruitmentApplication.objects.filter(pk=OuterRef('pk')).order_by()
+            .annotate(vector=application_search_vector()).values('vector')
+        )
+        return self.update(search_vector=Subquery(vectors))
+
+    def search(self, terms: str):
+        """
+        Applications matching web-search style `terms` ("quoted phrases", -excluded
+        words, OR), best match first. Without Postgres, every word has to appear in
+        one of the FALLBACK_SEARCH_FIELDS instead, and results stay in id order.
+        """
+        if connection.vendor == 'postgresql':
+            query = SearchQuery(terms, search_type='websearch', config=SEARCH_CONFIG)
+            return (
+                self.filter(search_vector=query)
+                .annotate(rank=SearchRank(F('search_vector'), query))
+                .order_by('-rank', 'id')
+            )
+
+        matches = Q()
+        for word in terms.split():
+            any_field = Q()
+            for field in FALLBACK_SEARCH_FIELDS:
+                any_field |= Q(**{f'{field}__icontains': word})
+            matches &= any_field
+        return self.filter(matches).order_by('id')
+
 
 # RECRUITMENT APPLICATIONS MODEL
 class RecruitmentApplication(models.Model):
     recruitment_session = models.ForeignKey(
         RecruitmentSession,
         on_delete=models.CASCADE,
-        related_name='applications'
+        related_name='applications',
+        # Covered by the (recruitment_session, status, id) index below
+        db_index=False
     )
     status = models.CharField(
         max_length=20,
         choices=ApplicationStatus.choices,
         default=ApplicationStatus.UNDER_REVIEW
     )
+    # Maintained by update_search_vectors(), run by api.signals after a 1-to-1 record is saved and committed
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = RecruitmentApplicationQuerySet.as_manager()
 
     class Meta:
         ordering = ['id']
+        indexes = [
+            # Review list and exports: by session, optionally by status, in id order
+            models.Index(fields=['recruitment_session', 'status', 'id']),
+            models.Index(fields=['status', 'id']),
+            GinIndex(fields=['search_vector']),
+        ]
         verbose_name = "Recruitment Application"
         verbose_name_plural = "Recruitment Applications"
 
@@ -201,5 +319,9 @@ class RolePreferences(models.Model):
     class Meta:
         verbose_name = "Role Preference"
         verbose_name_plural = "Role Preferences"
+        indexes = [
+            # Exports filtered by preferred role join back on application_id
+            models.Index(fields=['preferred_role', 'application']),
+        ]
     def __str__(self):
         return f"Preferred: {self.preferred_role}, Secondary: {self.secondary_role}"
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
+from api.images import schedule_variants
 
 
 class UserRole(models.TextChoices):
@@ -42,8 +43,14 @@ class Student(models.Model):
     Model representing a student. Inherits from User using OneToOne relationship.
     """
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='student')
-    roll_no = models.CharField(max_length=20, default="")
+    roll_no = models.CharField(max_length=20, default="", db_index=True)
     club = models.CharField(max_length=50)
     title = models.CharField(max_length=30, null=True, blank=True) # Designation in the ACM hierarchy structure
     profile_pic = models.ImageField(upload_to='profile_pics/', default='profile_pics/default.jpg')
     profile_desc = models.TextField(max_length=200, null=True, blank=True)
+
+    def save(self, *args, **kwargs):
+        uploaded = bool(self.profile_pic) and not self.profile_pic._committed
+        super().save(*args, **kwargs)
+        if uploaded:
+            schedule_variants(self.profile_pic, 'members')
@@ -0,0 +1,60 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination. Pages are fetched with a `WHERE key < cursor`
+    filter on the ordering key instead of an OFFSET scan, so fetching a page costs
+    the same no matter how deep it is and rows inserted meanwhile never shift pages.
+
+    Pagination is opt-in: it is only applied when the request passes `cursor`
+    or `page_size`, so existing clients keep receiving plain lists.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class IdCursorPagination(KeysetCursorPagination):
+    ordering = 'id'
+
+
+class CreatedAtCursorPagination(KeysetCursorPagination):
+    ordering = ('-createdAt', '-id')
+
+
+class DateCursorPagination(KeysetCursorPagination):
+    ordering = ('-date', '-id')
+
+
+class RankedPagination(PageNumberPagination):
+    """
+    Page-number pagination for results ordered by a computed score, such as a
+    search rank, which a keyset cursor can't follow.
+
+    Search results are always paginated; otherwise pagination is opt-in through
+    `page` or `page_size`, like KeysetCursorPagination.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    search_query_param = 'search'
+
+    def is_requested(self, request):
+        params = request.query_params
+        return any(param in params for param in (self.page_query_param, self.page_size_query_param,
+                                                 self.search_query_param))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
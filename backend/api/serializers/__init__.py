@@ -2,9 +2,11 @@ from .admin import AdminSerializer
 from .bill import BillSerializer
 from .blog import BlogSerializer, BlogImageSerializer, BlogUpdateSerializer, BlogUploadSerializer, InlineImageSerializer
 from .event import EventSerializer, EventTypeSerializer, EventWriteSerializer, EventRegistrationCreateSerializer, RegistrationStatusUpdateSerializer, EventParticipantSerializer, EventParticipantReadSerializer, EventRegistrationReadSerializer
-from .meeting import MeetingSerializer, MeetingAttendanceSerializer
+from .meeting import MeetingSerializer, MeetingAttendanceSerializer, MeetingCreateSerializer
 from .user import UserSerializer, UserListSerializer, StudentSerializer, StudentListSerializer, ProfileUserSerializer, \
-    ProfileUpdateSerializer, PublicStudentSerializer, PasswordChangeSerializer, OTPSerializer, LoginSerializer
+    ProfileUpdateSerializer, PublicStudentSerializer, PasswordChangeSerializer, OTPSerializer, LoginSerializer, \
+    StudentBulkImportSerializer
 from .recruitment import RecruitmentApplicationSubmissionSerializer, RecruitmentApplicationSerializer, \
     ApplicationStatusUpdateSerializer, RecruitmentApplicationDetailSerializer, AcademicInfoSerializer, \
-    PersonalInfoSerializer, RolePreferencesSerializer, RecruitmentSessionSerializer
+    PersonalInfoSerializer, RolePreferencesSerializer, RecruitmentSessionSerializer, \
+    BulkApplicationStatusSerializer
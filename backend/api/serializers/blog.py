@@ -1,6 +1,7 @@
 from typing import Optional
 from django.conf import settings
 from rest_framework import serializers
+from api.images import image_srcset
 from api.models import Blog, BlogImage, InlineImage
 
 # Allowed types & default max size (5 MB)
@@ -12,10 +13,11 @@ TEMP_INLINE_PREFIX = "/media/temp_inline/"
 class BlogImageSerializer(serializers.ModelSerializer):
     relative_path = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogImage
-        fields = ("id", "relative_path", "image_url")
+        fields = ("id", "relative_path", "image_url", "srcset")
 
     def get_relative_path(self, obj) -> str:
         return obj.image.name
@@ -26,11 +28,19 @@ class BlogImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_srcset(self, obj) -> dict:
+        return image_srcset(obj.image, self.context.get('request'))
+
 
 class InlineImageSerializer(serializers.ModelSerializer):
+    srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = InlineImage
-        fields = ['id', 'image', 'uploaded_at']
+        fields = ['id', 'image', 'srcset', 'uploaded_at']
+
+    def get_srcset(self, obj) -> dict:
+        return image_srcset(obj.image, self.context.get('request'))
 
 
 class BlogSerializer(serializers.ModelSerializer):
@@ -74,8 +84,7 @@ class BlogUploadSerializer(serializers.Serializer):
             createdBy=user
         )
 
-        for img in validated_data["images"]:
-            BlogImage.objects.create(blog=blog, image=img)
+        BlogImage.objects.attach(blog, validated_data["images"])
 
         return blog
 
@@ -108,7 +117,6 @@ class BlogUpdateSerializer(serializers.ModelSerializer):
             BlogImage.objects.filter(blog=instance, id__in=images_to_delete).delete()
 
         if new_images:
-            for img in new_images:
-                BlogImage.objects.create(blog=instance, image=img)
+            BlogImage.objects.attach(instance, new_images)
 
         return instance
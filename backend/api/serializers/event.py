@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from api.models import Event, EventType, EventRegistration, EventParticipant, RegistrationType, RegistrationStatus
 from django.db import transaction
+from api.cache import cached_image_url
+from api.images import image_srcset
 
 
 class EventTypeSerializer(serializers.ModelSerializer):
@@ -14,30 +16,43 @@ class EventSerializer(serializers.ModelSerializer):
     time_from = serializers.TimeField(format='%I:%M %p')
     time_to = serializers.TimeField(format='%I:%M %p')
     registration_count = serializers.SerializerMethodField()
+    seats_remaining = serializers.SerializerMethodField()
     image = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
         fields = '__all__'
-    
+        read_only_fields = ['reserved_seats']
+
     def get_registration_count(self, obj):
-        # Count all registrations except cancelled ones
-        return obj.registrations.exclude(status=RegistrationStatus.CANCELLED).count()
-    
+        # Prefer the count annotated by Event.objects.with_registration_stats()
+        count = getattr(obj, 'active_registration_count', None)
+        if count is None:
+            # The counter only tracks registrations that aren't cancelled
+            count = obj.reserved_seats
+        return count
+
+    def get_seats_remaining(self, obj):
+        remaining = getattr(obj, 'seats_remaining', None)
+        if remaining is None:
+            remaining = max(obj.total_seats - self.get_registration_count(obj), 0)
+        return remaining
+
     def get_image(self, obj):
         request = self.context.get('request')
-        if obj.image and hasattr(obj.image, 'url'):
-            try:
-                # Check if file exists
-                if obj.image.storage.exists(obj.image.name):
-                    if request:
-                        return request.build_absolute_uri(obj.image.url)
-                    return obj.image.url
-            except:
-                pass
+        # Existence is checked against the image cache, not storage, on every row
+        url = cached_image_url(obj.image)
+        if url:
+            if request:
+                return request.build_absolute_uri(url)
+            return url
         # Return default image or None
         return None
 
+    def get_image_srcset(self, obj) -> dict:
+        return image_srcset(obj.image, self.context.get('request'))
+
 
 class EventWriteSerializer(serializers.ModelSerializer):
     event_type = serializers.PrimaryKeyRelatedField(
@@ -91,17 +106,10 @@ class EventRegistrationCreateSerializer(serializers.ModelSerializer):
             'participants',
         ]
 
-    # For enforcing the total seats/spots limit
     def validate(self, data):
-        event = data['event']
         participants = data.get('participants', [])
         reg_type = data['registration_type']
 
-        if event.registrations.count() >= event.total_seats:
-            raise serializers.ValidationError(
-                "No seats available for this event."
-            )
-
         if reg_type == RegistrationType.SINGLE and len(participants) != 1:
             raise serializers.ValidationError(
                 "Single registration must have exactly one participant."
@@ -119,6 +127,13 @@ class EventRegistrationCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         participants_data = validated_data.pop('participants')
 
+        # For enforcing the total seats/spots limit. The seat is taken atomically
+        # and given back if anything below fails and the transaction rolls back.
+        if not Event.objects.reserve_seat(validated_data['event'].pk):
+            raise serializers.ValidationError(
+                "No seats available for this event."
+            )
+
         registration = EventRegistration.objects.create(**validated_data)
 
         EventParticipant.objects.bulk_create([
@@ -139,6 +154,24 @@ class RegistrationStatusUpdateSerializer(serializers.ModelSerializer):
         model = EventRegistration
         fields = ['status']
 
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        # Re-read the status under a row lock so concurrent updates can't both move the seat counter
+        current_status = EventRegistration.objects.select_for_update().values_list(
+            'status', flat=True
+        ).get(pk=instance.pk)
+        new_status = validated_data.get('status', current_status)
+
+        if current_status == RegistrationStatus.CANCELLED and new_status != RegistrationStatus.CANCELLED:
+            if not Event.objects.reserve_seat(instance.event_id):
+                raise serializers.ValidationError(
+                    "No seats available for this event."
+                )
+        elif current_status != RegistrationStatus.CANCELLED and new_status == RegistrationStatus.CANCELLED:
+            Event.objects.release_seat(instance.event_id)
+
+        return super().update(instance, validated_data)
+
 
 class EventParticipantReadSerializer(serializers.ModelSerializer):
     class Meta:
@@ -1,5 +1,7 @@
+from django.db import transaction
 from rest_framework import serializers
-from api.models import Meeting, MeetingAttendance
+from api.models import Meeting, MeetingAttendance, User
+from api.models.meeting import AttendanceStatus
 
 class MeetingAttendanceSerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,3 +16,39 @@ class MeetingSerializer(serializers.ModelSerializer):
     class Meta:
         model = Meeting
         fields = '__all__'
+
+
+class AttendanceEntrySerializer(serializers.Serializer):
+    # A plain id: users are checked in one query for the whole list, not one per row
+    user = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=AttendanceStatus.choices)
+
+
+class MeetingCreateSerializer(MeetingSerializer):
+    """
+    Creates a meeting together with its attendance records. All rows are
+    validated in memory, and everything is written in one transaction with a
+    single bulk INSERT for the attendance.
+    """
+    attendance = AttendanceEntrySerializer(many=True, write_only=True)
+
+    def validate_attendance(self, value):
+        user_ids = [row['user'] for row in value]
+        if len(user_ids) != len(set(user_ids)):
+            raise serializers.ValidationError("Attendance contains the same user more than once.")
+
+        existing_ids = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+        missing_ids = sorted(set(user_ids) - existing_ids)
+        if missing_ids:
+            raise serializers.ValidationError(f"Users not found: {missing_ids}")
+        return value
+
+    @transaction.atomic
+    def create(self, validated_data):
+        attendance_data = validated_data.pop('attendance')
+        meeting = Meeting.objects.create(**validated_data)
+        MeetingAttendance.objects.bulk_create([
+            MeetingAttendance(meeting=meeting, user_id=row['user'], status=row['status'])
+            for row in attendance_data
+        ])
+        return meeting
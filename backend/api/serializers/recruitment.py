@@ -13,8 +13,10 @@ Models needed (from Member 1 - Aleesha):
 - RolePreferences
 """
 
+from django.db import transaction
 from rest_framework import serializers
 from api.models import (
+    ApplicationStatus,
     RecruitmentSession,
     RecruitmentApplication,
     PersonalInfo,
@@ -177,7 +179,8 @@ class RecruitmentApplicationSubmissionSerializer(serializers.ModelSerializer):
     - academic_info: Nested AcademicInfo data
     - role_preferences: Nested RolePreferences data
     
-    The create() method handles creating all 4 models in the correct order.
+    The create() method handles creating all 4 models in the correct order,
+    in one transaction.
     """
     # Nested serializers for write operations
     personal_info = PersonalInfoSerializer()
@@ -192,6 +195,7 @@ class RecruitmentApplicationSubmissionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'status']
     
+    @transaction.atomic
     def create(self, validated_data):
         """
         Create a RecruitmentApplication with all related 1-to-1 records.
@@ -200,6 +204,10 @@ class RecruitmentApplicationSubmissionSerializer(serializers.ModelSerializer):
         1. Extract nested data for personal, academic, and preferences
         2. Create the parent RecruitmentApplication instance first
         3. Use the parent's ID to create the three related 1-to-1 records
+        4. Keep the created records on the application, so the response is
+           built without fetching them back
+
+        Either all four rows are written or none is.
         """
         # Extract nested data
         personal_data = validated_data.pop('personal_info')
@@ -213,9 +221,9 @@ class RecruitmentApplicationSubmissionSerializer(serializers.ModelSerializer):
         )
         
         # Create related 1-to-1 records linked to the application
-        PersonalInfo.objects.create(application=application, **personal_data)
-        AcademicInfo.objects.create(application=application, **academic_data)
-        RolePreferences.objects.create(application=application, **preferences_data)
+        application.personal_info = PersonalInfo.objects.create(application=application, **personal_data)
+        application.academic_info = AcademicInfo.objects.create(application=application, **academic_data)
+        application.role_preferences = RolePreferences.objects.create(application=application, **preferences_data)
         
         return application
 
@@ -225,7 +233,7 @@ class RecruitmentApplicationSubmissionSerializer(serializers.ModelSerializer):
         """
         return {
             'id': instance.id,
-            'recruitment_session': instance.recruitment_session.id,
+            'recruitment_session': instance.recruitment_session_id,
             'status': instance.status,
             'personal_info': PersonalInfoSerializer(instance.personal_info).data,
             'academic_info': AcademicInfoSerializer(instance.academic_info).data,
@@ -241,3 +249,17 @@ class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = RecruitmentApplication
         fields = ['status']
+
+
+class BulkApplicationStatusSerializer(serializers.Serializer):
+    """
+    Payload of a bulk status transition: the new status, plus the ids of the
+    applications to move. Without ids, the applications are selected by filters.
+    """
+    status = serializers.ChoiceField(choices=ApplicationStatus.choices)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=5000,
+    )
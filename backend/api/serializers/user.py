@@ -1,9 +1,26 @@
+from collections import Counter
 from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import ValidationError
-from api.models import User, Student
+from api.cache import bump_members_version
+from api.images import image_srcset
+from api.models import User, Student, UserRole
+from api.utils import hash_passwords, send_passwords
 from django.contrib.auth import authenticate
 
+ROLL_NO_REGEX = '^(?:FA|SP)[0-9]{2}-B(?:CS|AI|SE)-[0-9]{3}$'
+CLUB_CHOICES = [
+    'codehub',
+    'graphics_and_media',
+    'social_media_and_marketing',
+    'registration_and_decor',
+    'events_and_logistics',
+    ''  # Allow empty club for executives
+]
+# Executive titles that don't require a club (ACM-wide positions)
+EXECUTIVE_TITLES = ['PRESIDENT', 'VICE PRESIDENT', 'SECRETARY', 'TREASURER']
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -14,25 +31,11 @@ class UserSerializer(serializers.ModelSerializer):
 
 class StudentSerializer(serializers.ModelSerializer):
     user = UserSerializer()
-    roll_no = serializers.RegexField(regex='^(?:FA|SP)[0-9]{2}-B(?:CS|AI|SE)-[0-9]{3}$', max_length=20,
-                                     allow_blank=False)
-    club = serializers.ChoiceField(choices=[
-        'codehub',
-        'graphics_and_media',
-        'social_media_and_marketing',
-        'registration_and_decor',
-        'events_and_logistics',
-        ''  # Allow empty club for executives
-    ],
-        allow_blank=True,
-        required=False
-    )
+    roll_no = serializers.RegexField(regex=ROLL_NO_REGEX, max_length=20, allow_blank=False)
+    club = serializers.ChoiceField(choices=CLUB_CHOICES, allow_blank=True, required=False)
     title = serializers.CharField(required=False, allow_blank=True)
     content = serializers.CharField(required=False)
 
-    # Executive titles that don't require a club (ACM-wide positions)
-    EXECUTIVE_TITLES = ['PRESIDENT', 'VICE PRESIDENT', 'SECRETARY', 'TREASURER']
-
     class Meta:
         model = Student
         fields = '__all__'
@@ -43,7 +46,7 @@ class StudentSerializer(serializers.ModelSerializer):
         club = data.get('club', '')
 
         # If not an executive title and club is empty, raise error
-        if title not in self.EXECUTIVE_TITLES and not club:
+        if title not in EXECUTIVE_TITLES and not club:
             raise ValidationError({'club': 'Club selection is required for non-executive members.'})
 
         return data
@@ -73,6 +76,85 @@ class StudentSerializer(serializers.ModelSerializer):
         return instance
 
 
+class StudentImportRowSerializer(serializers.Serializer):
+    """ A single flat row (CSV line or JSON object) of a bulk student import. """
+    username = serializers.CharField(max_length=150)
+    email = serializers.EmailField()
+    first_name = serializers.CharField(max_length=150)
+    last_name = serializers.CharField(max_length=150)
+    phone_number = serializers.RegexField(regex=r'^\+92[0-9]{10}$', max_length=13)
+    password = serializers.CharField(required=False)
+    role = serializers.ChoiceField(choices=UserRole.choices, default=UserRole.STUDENT)
+    roll_no = serializers.RegexField(regex=ROLL_NO_REGEX, max_length=20)
+    club = serializers.ChoiceField(choices=CLUB_CHOICES, allow_blank=True, default='')
+    title = serializers.CharField(max_length=30, required=False, allow_blank=True)
+
+    def validate(self, data):
+        if data.get('title', '') not in EXECUTIVE_TITLES and not data['club']:
+            raise ValidationError({'club': 'Club selection is required for non-executive members.'})
+        return data
+
+
+class StudentBulkImportSerializer(serializers.Serializer):
+    """
+    Validates every row of an import up front and creates all users, students
+    and tokens in one transaction.
+
+    Uniqueness of username, email, phone number and roll number is checked with one
+    query per field (plus duplicates inside the import itself) instead of per row.
+    Passwords default to `context['default_password']`.
+    """
+    students = StudentImportRowSerializer(many=True, allow_empty=False)
+
+    UNIQUE_FIELDS = {'username': User, 'email': User, 'phone_number': User, 'roll_no': Student}
+
+    def validate_students(self, rows):
+        errors = [{} for _ in rows]
+        for field, model in self.UNIQUE_FIELDS.items():
+            values = [row[field] for row in rows]
+            counts = Counter(values)
+            taken = set(model.objects.filter(**{f'{field}__in': set(values)}).values_list(field, flat=True))
+            for row_errors, value in zip(errors, values):
+                if value in taken:
+                    row_errors[field] = [f'{field} "{value}" already exists.']
+                elif counts[value] > 1:
+                    row_errors[field] = [f'{field} "{value}" is repeated in this import.']
+
+        if any(errors):
+            raise ValidationError(errors)
+        return rows
+
+    def create(self, validated_data):
+        rows = validated_data['students']
+        default_password = self.context.get('default_password')
+        passwords = [row.get('password') or default_password for row in rows]
+        hashed = hash_passwords(passwords)
+
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(
+                    username=row['username'], email=row['email'], first_name=row['first_name'],
+                    last_name=row['last_name'], phone_number=row['phone_number'], role=row['role'],
+                    password=password,
+                )
+                for row, password in zip(rows, hashed)
+            ])
+            students = Student.objects.bulk_create([
+                Student(user=user, roll_no=row['roll_no'], club=row['club'], title=row.get('title', ''))
+                for user, row in zip(users, rows)
+            ])
+            tokens = Token.objects.bulk_create([
+                Token(user=user, key=Token.generate_key()) for user in users
+            ])
+            send_passwords(
+                (user.email, user.username, password) for user, password in zip(users, passwords)
+            )
+            # bulk_create skips post_save, so the member signal handlers never fire
+            transaction.on_commit(bump_members_version)
+
+        return list(zip(students, tokens))
+
+
 # NOTE: This serializer is for the students list view
 class UserListSerializer(serializers.ModelSerializer):
     class Meta:
@@ -89,14 +171,18 @@ class StudentListSerializer(serializers.ModelSerializer):
 
 class PublicStudentSerializer(serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
+    profile_pic_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Student
-        fields = ['full_name', 'title', 'profile_pic','user_id','club']
+        fields = ['full_name', 'title', 'profile_pic', 'profile_pic_srcset', 'user_id', 'club']
 
     def get_full_name(self, obj):
         return f"{obj.user.first_name} {obj.user.last_name}"
 
+    def get_profile_pic_srcset(self, obj) -> dict:
+        return image_srcset(obj.profile_pic, self.context.get('request'))
+
 
 class ProfileUserSerializer(serializers.ModelSerializer):
     """Serializer for updating user info in profile updates"""
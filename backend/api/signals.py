@@ -0,0 +1,107 @@
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from api.authentication import forget_tokens, token_cache_enabled
+from api.cache import bump_meeting_version, bump_members_version, bump_content_version
+from api.images import delete_file_on_commit
+from api.models import Meeting, MeetingAttendance, User, Student, Event, EventType, EventRegistration, Blog, \
+    BlogImage, RecruitmentSession, RecruitmentApplication, PersonalInfo, AcademicInfo, RolePreferences
+
+
+# Versions are bumped after commit, so a concurrent read can't re-cache the old rows under the new version
+@receiver([post_save, post_delete], sender=Meeting)
+def meeting_changed(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_meeting_version, instance.pk))
+
+
+@receiver([post_save, post_delete], sender=MeetingAttendance)
+def attendance_changed(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_meeting_version, instance.meeting_id))
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=Student)
+def member_changed(sender, instance, **kwargs):
+    transaction.on_commit(bump_members_version)
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    # After commit, so a concurrent request can't re-cache the token before the delete is visible
+    transaction.on_commit(partial(forget_tokens, instance.key))
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=Student)
+def profile_changed(sender, instance, **kwargs):
+    # Role, title and club are read from the cached user by the permission classes
+    if not token_cache_enabled():
+        return
+    user_id = instance.pk if sender is User else instance.user_id
+    keys = list(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+    if keys:
+        transaction.on_commit(partial(forget_tokens, *keys))
+
+
+# Content groups read by the cached list endpoints (see CachedResponseMixin)
+CONTENT_GROUPS = {
+    Event: 'events',
+    EventType: 'events',
+    # Registrations change an event's seat counts
+    EventRegistration: 'events',
+    Blog: 'blogs',
+    BlogImage: 'blogs',
+    RecruitmentSession: 'recruitment-sessions',
+}
+
+
+@receiver([post_save, post_delete], sender=Event)
+@receiver([post_save, post_delete], sender=EventType)
+@receiver([post_save, post_delete], sender=EventRegistration)
+@receiver([post_save, post_delete], sender=Blog)
+@receiver([post_save, post_delete], sender=BlogImage)
+@receiver([post_save, post_delete], sender=RecruitmentSession)
+def content_changed(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_content_version, CONTENT_GROUPS[sender]))
+
+
+@receiver(post_delete, sender=BlogImage)
+def blog_image_deleted(sender, instance, **kwargs):
+    # Covers queryset deletes and the cascade from a deleted blog, neither of which touches storage
+    delete_file_on_commit(instance.image)
+
+
+@receiver([post_save, post_delete], sender=RecruitmentApplication)
+def application_changed(sender, instance, **kwargs):
+    # New submissions and status changes invalidate the session's cached stats
+    transaction.on_commit(partial(bump_content_version, f"applications-{instance.recruitment_session_id}"))
+
+
+@receiver(post_save, sender=PersonalInfo)
+@receiver(post_save, sender=AcademicInfo)
+@receiver(post_save, sender=RolePreferences)
+def application_details_changed(sender, instance, **kwargs):
+    # Covers every way the records are written: submissions, the admin, the shell
+    reindex_on_commit(instance.application_id)
+
+
+def reindex_on_commit(application_id):
+    """
+    Rebuilds an application's search vector once the transaction commits. All saves
+    of one transaction share a single callback, so a submission writing three records
+    costs one UPDATE. Rolled-back transactions drop the callback with everything else.
+    """
+    for _, callback, _ in transaction.get_connection().run_on_commit:
+        if getattr(callback, 'application_ids', None) is not None:
+            callback.application_ids.add(application_id)
+            return
+
+    def reindex():
+        # Closed once it runs, in case the hook lingers on the connection (as it does under TestCase)
+        application_ids, reindex.application_ids = reindex.application_ids, None
+        RecruitmentApplication.objects.filter(pk__in=application_ids).update_search_vectors()
+
+    reindex.application_ids = {application_id}
+    transaction.on_commit(reindex)
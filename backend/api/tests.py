@@ -1,11 +1,42 @@
 from django.urls import reverse
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase, APIClient, APITransactionTestCase
 from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from rest_framework.authtoken.models import Token
-from .models import UserRole, Blog, BlogImage
-from io import BytesIO
+from .models import UserRole, Blog, BlogImage, InlineImage, Event, EventType, EventRegistration, RegistrationType, \
+    RegistrationStatus, RecruitmentSession, RecruitmentApplication, PersonalInfo, AcademicInfo, RolePreferences, \
+    ApplicationStatus, Role, Meeting, MeetingAttendance, Student
+from .models.meeting import AttendanceStatus
+from .models import OutgoingEmail, EmailStatus
+from backend.auth_backends import MultiFieldAuthBackend
+from api.authentication import CachedTokenAuthentication, token_cache_key
+from api.utils import send_otp
+from api.images import file_deletion_queue
+from api.views.event import EventDetailView
+import csv
+import os
+import shutil
+import tempfile
+from time import perf_counter, sleep
+import json
+import threading
+import tracemalloc
+from datetime import date, time, timedelta
+from django.db import DatabaseError, connection
+from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
+from unittest import skipUnless
+from unittest.mock import patch
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from django.core.files.storage import FileSystemStorage
+from io import BytesIO, StringIO
 from PIL import Image
+from openpyxl import load_workbook
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 file = SimpleUploadedFile(
@@ -400,3 +431,1443 @@ class BlogDeleteViewTests(APITestCase):
         self.client.force_authenticate(user=self.user)
         response = self.client.delete("/api/blogs/9999/delete/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class EventListQueryCountTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('events-list-create')
+        self.event_type = EventType.objects.create(type='workshop')
+
+    def create_events(self, count):
+        events = Event.objects.bulk_create([
+            Event(
+                event_type=self.event_type,
+                title=f"Event {i}",
+                content="Some content",
+                time_from=time(10, 0),
+                time_to=time(12, 0),
+                total_seats=5,
+                reserved_seats=1,
+                image=None,
+            )
+            for i in range(count)
+        ])
+        for event in events:
+            EventRegistration.objects.create(event=event, registration_type=RegistrationType.SINGLE)
+            EventRegistration.objects.create(
+                event=event, registration_type=RegistrationType.SINGLE, status=RegistrationStatus.CANCELLED
+            )
+        return events
+
+    def test_registration_counts_are_annotated(self):
+        self.create_events(1)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["registration_count"], 1)
+        self.assertEqual(response.data[0]["seats_remaining"], 4)
+
+    def test_list_query_count_is_constant(self):
+        self.create_events(2)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_events(20)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 22)
+
+
+class EventImageCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('events-list-create')
+        self.event = Event.objects.create(
+            title="Event with image",
+            content="Some content",
+            time_from=time(10, 0),
+            time_to=time(12, 0),
+            image=SimpleUploadedFile('poster.jpg', b'image bytes', content_type='image/jpeg'),
+        )
+
+    def tearDown(self):
+        self.event.image.delete(save=False)
+
+    def test_uploaded_image_is_served_without_storage_lookup(self):
+        with patch.object(FileSystemStorage, 'exists') as exists:
+            response = self.client.get(self.url)
+        exists.assert_not_called()
+        self.assertTrue(response.data[0]["image"].endswith(self.event.image.url))
+
+    def test_missing_image_is_checked_once(self):
+        Event.objects.filter(pk=self.event.pk).update(image='events/missing.jpg')
+        with patch.object(FileSystemStorage, 'exists', return_value=False) as exists:
+            self.client.get(self.url)
+            response = self.client.get(self.url)
+        self.assertEqual(exists.call_count, 1)
+        self.assertIsNone(response.data[0]["image"])
+
+
+class BlogListCursorPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="author", password="pass1234", email="author@example.com")
+        self.url = reverse('blog-list')
+        for i in range(5):
+            Blog.objects.create(title=f"Blog {i}", content="Some content", createdBy=self.user)
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 5)
+
+    def test_pages_are_stable_under_inserts(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        first_page = [blog["title"] for blog in response.data["results"]]
+        self.assertEqual(first_page, ["Blog 4", "Blog 3"])
+
+        # A blog published between page fetches must not shift the following pages
+        with self.captureOnCommitCallbacks(execute=True):
+            Blog.objects.create(title="Blog 5", content="Some content", createdBy=self.user)
+
+        titles = list(first_page)
+        next_url = response.data["next"]
+        while next_url:
+            response = self.client.get(next_url)
+            titles += [blog["title"] for blog in response.data["results"]]
+            next_url = response.data["next"]
+        self.assertEqual(titles, ["Blog 4", "Blog 3", "Blog 2", "Blog 1", "Blog 0"])
+
+
+class BlogListQueryCountTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('blog-list')
+        authors = [
+            User.objects.create_user(
+                username=f"author{i}", password="pass1234", email=f"author{i}@example.com",
+                phone_number=f"+92300000000{i}"
+            )
+            for i in range(3)
+        ]
+        blogs = Blog.objects.bulk_create([
+            Blog(title=f"Blog {i}", content="Some content", createdBy=authors[i % len(authors)])
+            for i in range(300)
+        ])
+        BlogImage.objects.bulk_create([
+            BlogImage(blog=blog, image=f"blog_images/{blog.id}/image{n}.jpg")
+            for blog in blogs
+            for n in range(2)
+        ])
+
+    def test_list_runs_in_fixed_number_of_queries(self):
+        # One query for the blogs joined with their authors, one for all their images
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 300)
+        self.assertEqual(len(response.data[0]["images"]), 2)
+
+
+class EventSeatReservationTests(APITransactionTestCase):
+    def setUp(self):
+        self.url = reverse('registration-create')
+        self.event = Event.objects.create(
+            title="Popular event",
+            content="Some content",
+            time_from=time(10, 0),
+            time_to=time(12, 0),
+            total_seats=5,
+            image=None,
+        )
+
+    def registration_data(self, i):
+        return {
+            "event": self.event.pk,
+            "registration_type": RegistrationType.SINGLE,
+            "participants": [{
+                "name": f"Participant {i}",
+                "email": f"participant{i}@example.com",
+                "reg_no": f"FA22-BCS-{i:03}",
+                "current_semester": 5,
+                "department": "CS",
+                "phone_no": "+923000000000",
+            }],
+        }
+
+    def test_parallel_registrations_never_overbook(self):
+        status_codes = []
+        barrier = threading.Barrier(20)
+
+        def register(i):
+            try:
+                barrier.wait()
+                response = APIClient().post(self.url, self.registration_data(i), format='json')
+                status_codes.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=register, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.event.refresh_from_db()
+        self.assertEqual(status_codes.count(status.HTTP_201_CREATED), 5)
+        self.assertEqual(status_codes.count(status.HTTP_400_BAD_REQUEST), 15)
+        self.assertEqual(self.event.reserved_seats, 5)
+        self.assertEqual(self.event.registrations.count(), 5)
+
+    def test_cancelling_and_deleting_release_seats(self):
+        for i in range(2):
+            self.client.post(self.url, self.registration_data(i), format='json')
+        first, second = self.event.registrations.order_by('id')
+
+        self.client.patch(
+            reverse('registration-status-update', args=[first.pk]), {"status": RegistrationStatus.CANCELLED},
+            format='json'
+        )
+        self.client.delete(reverse('registration-delete', args=[second.pk]))
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.reserved_seats, 0)
+
+    def test_editing_an_event_keeps_reservations_made_meanwhile(self):
+        load_event = EventDetailView.get_object
+
+        def load_then_register(view):
+            event = load_event(view)
+            # A registration lands after the edit has loaded the event
+            self.client.post(self.url, self.registration_data(1), format='json')
+            return event
+
+        with patch.object(EventDetailView, 'get_object', load_then_register):
+            response = self.client.patch(
+                reverse('events-RUD', args=[self.event.pk]), {"title": "Renamed event"}, format='multipart'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.title, "Renamed event")
+        self.assertEqual(self.event.reserved_seats, 1)
+        self.assertEqual(self.event.registrations.count(), 1)
+
+
+# Benchmarks over tens of thousands of rows take minutes; run them with RUN_BENCHMARKS=1
+RUN_BENCHMARKS = os.environ.get("RUN_BENCHMARKS") == "1"
+
+
+def seed_applications(session, count, **application_fields):
+    applications = RecruitmentApplication.objects.bulk_create([
+        RecruitmentApplication(recruitment_session=session, **application_fields)
+        for _ in range(count)
+    ])
+    PersonalInfo.objects.bulk_create([
+        PersonalInfo(
+            application=app, first_name="Applicant", last_name=str(app.id),
+            email=f"applicant{app.id}@example.com", phone_number="+923000000000"
+        )
+        for app in applications
+    ])
+    AcademicInfo.objects.bulk_create([
+        AcademicInfo(
+            application=app, reg_no=f"FA22-BCS-{app.id:03}", current_semester=(app.id % 8) + 1,
+            program="BSCS", skills=["python", "django"]
+        )
+        for app in applications
+    ])
+    RolePreferences.objects.bulk_create([
+        RolePreferences(
+            application=app, preferred_role=Role.CODEHUB, secondary_role=Role.GRAPHICS,
+            join_purpose="To learn", weekly_availability="10 hours"
+        )
+        for app in applications
+    ])
+    return applications
+
+
+class RecruitmentExportTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('export-recruitment-excel')
+        self.session = RecruitmentSession.objects.create(
+            uni_session="FA24",
+            application_start=date(2024, 9, 1),
+            application_end=date(2024, 9, 15),
+            interview_start=date(2024, 9, 20),
+            interview_end=date(2024, 9, 25),
+            result_date=date(2024, 9, 30),
+        )
+
+    def export_peak_memory(self):
+        tracemalloc.start()
+        try:
+            response = self.client.get(self.url)
+            content = b"".join(response.streaming_content)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return content, peak
+
+    def test_excel_export_contains_every_application(self):
+        seed_applications(self.session, 3)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sheet = load_workbook(BytesIO(b"".join(response.streaming_content))).active
+        self.assertEqual(sheet.max_row, 4)
+        self.assertEqual(sheet.cell(row=2, column=3).value, "FA24")
+
+    @tag('benchmark')
+    @skipUnless(RUN_BENCHMARKS, "set RUN_BENCHMARKS=1 to run benchmarks")
+    @patch('api.views.recruitment.EXPORT_CHUNK_SIZE', 500)
+    def test_excel_export_memory_stays_flat(self):
+        seed_applications(self.session, 2000)
+        _, small_peak = self.export_peak_memory()
+
+        seed_applications(self.session, 18000)
+        content, large_peak = self.export_peak_memory()
+
+        rows = load_workbook(BytesIO(content), read_only=True).active.iter_rows()
+        self.assertEqual(sum(1 for _ in rows), 20001)
+        # 10x the applications must not mean anywhere near 10x the memory
+        self.assertLess(large_peak, small_peak * 2)
+
+    def test_csv_export_applies_filters(self):
+        seed_applications(self.session, 2)
+        seed_applications(self.session, 3, status=ApplicationStatus.ACCEPTED)
+        response = self.client.get(reverse('export-recruitment'), {"format": "csv", "status": "ACCEPTED"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0][0], "Application ID")
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(all(row[1] == ApplicationStatus.ACCEPTED for row in rows[1:]))
+
+    def test_ndjson_export_streams_one_object_per_line(self):
+        applications = seed_applications(self.session, 3)
+        response = self.client.get(reverse('export-recruitment'), {"format": "ndjson"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        records = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([record["application_id"] for record in records], [app.id for app in applications])
+        self.assertEqual(records[0]["session"], "FA24")
+
+    def test_export_requires_admin(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse('export-recruitment'), {"format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("detail", response.json())
+
+
+class MeetingPDFCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.meeting = Meeting.objects.create(end_time=time(12, 0), venue="Lab 1", agenda="- Intro")
+        MeetingAttendance.objects.create(meeting=self.meeting, user=self.admin, status=AttendanceStatus.PRESENT)
+        self.url = reverse('meeting.py-pdf', args=[self.meeting.pk])
+
+    def test_unchanged_meeting_is_served_from_cache(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first["Content-Type"], "application/pdf")
+
+        with patch('api.views.meeting.render_meeting_minutes') as render:
+            second = self.client.get(self.url)
+        render.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_if_none_match_returns_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_attendance_change_invalidates_cached_pdf(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            MeetingAttendance.objects.filter(meeting=self.meeting).get().delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class MeetingAttendanceStatsTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.meeting = Meeting.objects.create(end_time=time(12, 0), venue="Lab 1")
+        statuses = [AttendanceStatus.PRESENT] * 3 + [AttendanceStatus.ABSENT] * 2 + [AttendanceStatus.LEAVE]
+        for i, attendance_status in enumerate(statuses):
+            member = User.objects.create_user(
+                username=f"member{i}", password="pass1234", email=f"member{i}@example.com",
+                phone_number=f"+92300000000{i}"
+            )
+            MeetingAttendance.objects.create(meeting=self.meeting, user=member, status=attendance_status)
+
+    def test_counts_every_status_in_one_query(self):
+        with self.assertNumQueries(1):
+            counts = MeetingAttendance.objects.filter(meeting=self.meeting).status_counts()
+        self.assertEqual(counts, {"present": 3, "absent": 2, "leave": 1, "total": 6})
+
+    def test_stats_endpoint(self):
+        response = self.client.get(reverse('attendance-stats', args=[self.meeting.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"], {"present": 3, "absent": 2, "leave": 1, "total": 6})
+
+    def test_stats_for_missing_meeting(self):
+        response = self.client.get(reverse('attendance-stats', args=[9999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class MeetingBulkCreateTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN,
+            phone_number="+923000000000"
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('meeting.py-create')
+        self.members = User.objects.bulk_create([
+            User(username=f"member{i}", email=f"member{i}@example.com", phone_number=f"+92311{i:07}")
+            for i in range(200)
+        ])
+
+    def meeting_data(self, attendance):
+        return {
+            "date": "2026-01-15",
+            "start_time": "14:00",
+            "end_time": "15:00",
+            "venue": "Lab 1",
+            "agenda": "Planning",
+            "attendance": attendance,
+        }
+
+    def test_200_member_meeting_in_constant_queries(self):
+        attendance = [{"user": member.id, "status": AttendanceStatus.PRESENT} for member in self.members]
+        # Savepoint, user lookup, meeting INSERT, attendance bulk INSERT, release savepoint
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, self.meeting_data(attendance), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(MeetingAttendance.objects.count(), 200)
+
+    def test_invalid_row_leaves_no_orphan_meeting(self):
+        attendance = [
+            {"user": self.members[0].id, "status": AttendanceStatus.PRESENT},
+            {"user": self.members[1].id, "status": "LATE"},
+        ]
+        response = self.client.post(self.url, self.meeting_data(attendance), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Meeting.objects.exists())
+
+    def test_unknown_user_is_rejected(self):
+        attendance = [{"user": 999999, "status": AttendanceStatus.PRESENT}]
+        response = self.client.post(self.url, self.meeting_data(attendance), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("attendance", response.data["message"])
+        self.assertFalse(Meeting.objects.exists())
+
+
+def seed_users(start, stop):
+    password = make_password("pass1234")
+    users = User.objects.bulk_create([
+        User(
+            username=f"user{i}", email=f"user{i}@example.com", password=password,
+            phone_number=f"+92312{i:07}"
+        )
+        for i in range(start, stop)
+    ])
+    Student.objects.bulk_create([
+        Student(user=user, roll_no=f"FA{i // 1000:02}-BCS-{i % 1000:03}", club="codehub")
+        for i, user in zip(range(start, stop), users)
+    ])
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE api_user")
+        cursor.execute("ANALYZE api_student")
+
+
+class MultiFieldLoginTests(APITestCase):
+    IDENTIFIERS = ["user12", "user12@example.com", "FA00-BCS-012"]
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_users(0, 50)
+        cls.backend = MultiFieldAuthBackend()
+
+    def lookup_plans(self):
+        return [User.objects.filter(**{self.backend.lookup_field(i): i}).explain() for i in self.IDENTIFIERS]
+
+    def time_lookups(self, rounds=200):
+        started = perf_counter()
+        for _ in range(rounds):
+            for identifier in self.IDENTIFIERS:
+                self.backend.get_by_identifier(identifier)
+        return perf_counter() - started
+
+    def test_each_identifier_uses_one_indexed_lookup(self):
+        for identifier in self.IDENTIFIERS:
+            with self.subTest(identifier=identifier):
+                with self.assertNumQueries(1):
+                    user = self.backend.authenticate(None, username=identifier, password="pass1234")
+                self.assertEqual(user.username, "user12")
+
+        # Too few rows for the planner to pick an index on its own; this only checks one exists
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        for plan in self.lookup_plans():
+            self.assertIn("Index", plan)
+            self.assertNotIn("Seq Scan", plan)
+
+    @tag('benchmark')
+    @skipUnless(RUN_BENCHMARKS, "set RUN_BENCHMARKS=1 to run benchmarks")
+    def test_lookups_stay_fast_at_twenty_thousand_users(self):
+        small = self.time_lookups()
+        seed_users(50, 20000)
+
+        for plan in self.lookup_plans():
+            self.assertNotIn("Seq Scan", plan)
+        # Scanning 400x the users would be many times slower; an index lookup barely notices
+        self.assertLess(self.time_lookups(), small * 2)
+
+    def test_wrong_password_is_rejected(self):
+        self.assertIsNone(self.backend.authenticate(None, username="user1@example.com", password="wrong"))
+
+
+@override_settings(AUTH_TOKEN_CACHE_ENABLED=True)
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="lead", password="pass1234", email="lead@example.com", role=UserRole.STUDENT
+        )
+        self.student = Student.objects.create(user=self.user, roll_no="FA21-BCS-001", club="codehub", title="member")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_warm_lookup_does_not_query(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            user, token = self.auth.authenticate_credentials(self.token.key)
+            self.assertEqual(user.student.club, "codehub")
+        self.assertEqual(token.key, self.token.key)
+
+    def test_password_hash_is_not_cached(self):
+        self.auth.authenticate_credentials(self.token.key)
+        cached = cache.get(token_cache_key(self.token.key))
+        self.assertIn("password", cached.user.get_deferred_fields())
+        self.assertTrue(cached.user.check_password("pass1234"))
+
+    def test_role_and_profile_changes_invalidate(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.role = UserRole.LEAD
+            self.user.save()
+            self.student.title = "treasurer"
+            self.student.save()
+
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(user.role, UserRole.LEAD)
+        self.assertEqual(user.student.title, "treasurer")
+
+    def test_logout_invalidates(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.auth.authenticate_credentials(self.token.key)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('logout'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_invalidation_waits_for_commit(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.role = UserRole.LEAD
+            self.user.save()
+        self.assertIsNotNone(cache.get(token_cache_key(self.token.key)))
+
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+    @override_settings(AUTH_TOKEN_CACHE_ENABLED=None)
+    def test_process_local_cache_is_not_used(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+        # Another worker's change is seen right away, without any invalidation
+        User.objects.filter(pk=self.user.pk).update(role=UserRole.LEAD)
+        with self.assertNumQueries(1):
+            user, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(user.role, UserRole.LEAD)
+
+    @override_settings(AUTH_TOKEN_CACHE_ENABLED=False)
+    def test_profile_saves_skip_invalidation_without_the_cache(self):
+        # Just the UPDATE: the user's tokens aren't looked up
+        with self.assertNumQueries(1):
+            self.user.save()
+
+
+class EmailOutboxTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="student", password="pass1234", email="student@example.com", role=UserRole.STUDENT
+        )
+
+    def test_otp_request_queues_email_without_sending(self):
+        response = self.client.post(reverse('otp'), {"email": "student@example.com"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.recipients, ["student@example.com"])
+        self.assertEqual(email.status, EmailStatus.PENDING)
+
+    def test_worker_sends_due_emails_in_batches(self):
+        for i in range(5):
+            send_otp(f"user{i}@example.com", otp=1000 + i)
+
+        call_command('send_queued_emails', batch_size=2, stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(OutgoingEmail.objects.filter(status=EmailStatus.SENT).count(), 5)
+        self.assertIn("1003", mail.outbox[3].body)
+        # Delivered bodies (OTPs, initial passwords) are not kept in the outbox
+        self.assertFalse(OutgoingEmail.objects.exclude(message='').exists())
+
+    def test_failed_delivery_is_retried_later_then_given_up(self):
+        send_otp("student@example.com", otp=1234)
+
+        with patch('api.management.commands.send_queued_emails.EmailMessage.send', side_effect=OSError("SMTP down")):
+            call_command('send_queued_emails', max_attempts=2, stdout=StringIO())
+            email = OutgoingEmail.objects.get()
+            self.assertEqual((email.status, email.attempts, email.last_error), (EmailStatus.PENDING, 1, "SMTP down"))
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+            OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+            call_command('send_queued_emails', max_attempts=2, stdout=StringIO())
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts, email.message), (EmailStatus.FAILED, 2, ''))
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_unreachable_server_fails_every_claimed_email(self):
+        for i in range(3):
+            send_otp(f"user{i}@example.com", otp=1000 + i)
+
+        with patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError("Connection refused")):
+            call_command('send_queued_emails', stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 0)
+        for email in OutgoingEmail.objects.all():
+            self.assertEqual((email.status, email.attempts, email.last_error),
+                             (EmailStatus.PENDING, 1, "Connection refused"))
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+    def test_emails_of_a_dead_worker_are_claimed_again(self):
+        send_otp("student@example.com", otp=1234)
+        OutgoingEmail.objects.update(status=EmailStatus.SENDING, attempts=1,
+                                     next_attempt_at=timezone.now() + timedelta(minutes=5))
+        call_command('send_queued_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 0)
+
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        call_command('send_queued_emails', stdout=StringIO())
+        email = OutgoingEmail.objects.get()
+        self.assertEqual((email.status, email.attempts), (EmailStatus.SENT, 2))
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class BulkSignupTests(APITestCase):
+    FIELDS = ["username", "email", "first_name", "last_name", "phone_number", "roll_no", "club", "title"]
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN,
+            phone_number="+923000000000"
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('bulk-signup')
+
+    def rows(self, count, start=0, club="codehub"):
+        return [
+            {
+                "username": f"student{i}", "email": f"student{i}@example.com", "first_name": "Student",
+                "last_name": str(i), "phone_number": f"+92311{i:07}", "roll_no": f"FA23-BCS-{i:03}",
+                "club": club, "title": "",
+            }
+            for i in range(start, start + count)
+        ]
+
+    def csv_file(self, rows):
+        buffer = StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+        return SimpleUploadedFile("students.csv", buffer.getvalue().encode(), content_type="text/csv")
+
+    def test_csv_import_creates_users_students_and_tokens(self):
+        response = self.client.post(self.url, {"file": self.csv_file(self.rows(20))}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["data"]), 20)
+
+        self.assertEqual(Student.objects.filter(club="codehub").count(), 20)
+        self.assertEqual(Token.objects.filter(user__username__startswith="student").count(), 20)
+        self.assertEqual(OutgoingEmail.objects.count(), 20)
+        user = User.objects.get(username="student7")
+        self.assertTrue(user.check_password("12345"))
+        self.assertEqual(response.data["data"][7]["token"], user.auth_token.key)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, {"students": self.rows(2)}, format='json')
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(self.url, {"students": self.rows(30, start=100)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_conflicts_are_reported_per_row_and_nothing_is_created(self):
+        rows = self.rows(3)
+        rows[1]["email"] = "admin@example.com"
+        rows[2]["roll_no"] = rows[0]["roll_no"]
+
+        response = self.client.post(self.url, {"students": rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["message"]["students"]
+        self.assertEqual(errors[0].keys(), {"roll_no"})
+        self.assertEqual(errors[1].keys(), {"email"})
+        self.assertFalse(Student.objects.exists())
+
+    def test_lead_cannot_import_another_club(self):
+        lead = User.objects.create_user(
+            username="lead", password="pass1234", email="lead@example.com", role=UserRole.LEAD,
+            phone_number="+923000000001"
+        )
+        Student.objects.create(user=lead, roll_no="FA20-BCS-001", club="codehub")
+        self.client.force_authenticate(user=lead)
+
+        response = self.client.post(self.url, {"students": self.rows(2, club="graphics_and_media")}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Student.objects.count(), 1)
+
+    def test_lead_without_student_profile_is_forbidden(self):
+        lead = User.objects.create_user(
+            username="lead", password="pass1234", email="lead@example.com", role=UserRole.LEAD,
+            phone_number="+923000000001"
+        )
+        self.client.force_authenticate(user=lead)
+
+        response = self.client.post(self.url, {"students": self.rows(2)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Student.objects.exists())
+
+
+class StudentListQueryCountTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(10):
+            user = User.objects.create_user(
+                username=f"member{i}", password="pass1234", email=f"member{i}@example.com",
+                role=UserRole.STUDENT, phone_number=f"+92301{i:07}", first_name="Member", last_name=str(i)
+            )
+            Student.objects.create(user=user, roll_no=f"FA22-BCS-{i:03}", club="codehub", title="member")
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN,
+            phone_number="+923000000000"
+        )
+
+    def test_students_list_runs_one_query(self):
+        self.client.force_authenticate(user=self.admin)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('students-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 10)
+        member = next(row for row in response.data if row["roll_no"] == "FA22-BCS-000")
+        self.assertEqual(member["user"]["username"], "member0")
+
+    def test_public_students_list_runs_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('public-students'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 10)
+        self.assertIn("Member 0", {row["full_name"] for row in response.data})
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('events-list-create')
+        self.event_type = EventType.objects.create(type='workshop')
+        self.create_event("First event")
+
+    def create_event(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Event.objects.create(
+                title=title, content="Some content", event_type=self.event_type,
+                time_from=time(10, 0), time_to=time(12, 0), image=None,
+            )
+
+    def test_repeated_reads_skip_the_database(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertIn("Last-Modified", second)
+
+    def test_cached_data_is_rendered_per_request(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_ACCEPT="text/html")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+        self.assertIn(b"First event", response.content)
+
+    def test_conditional_requests_return_not_modified(self):
+        first = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_model_changes_invalidate_cached_responses(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.create_event("Second event")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_query_params_are_cached_separately(self):
+        self.create_event("Second event")
+        self.assertEqual(len(self.client.get(self.url).data), 2)
+        self.assertEqual(len(self.client.get(self.url, {"page_size": 1}).data["results"]), 1)
+
+
+def jpeg_upload(name, size):
+    # A gradient, so the encoded size is realistic rather than that of a flat colour
+    image = Image.linear_gradient('L').resize(size).convert('RGB')
+    buffer = BytesIO()
+    image.save(buffer, format='JPEG', quality=95)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+def png_upload(name, size, color='red'):
+    buffer = BytesIO()
+    Image.new('RGB', size, color).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+class ImageVariantTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.settings = override_settings(MEDIA_ROOT=self.media_root, IMAGE_VARIANTS_ASYNC=False)
+        self.settings.enable()
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.media_root)
+
+    def create_event(self, image):
+        return Event.objects.create(
+            title="Event", content="Some content", time_from=time(10, 0), time_to=time(12, 0), image=image
+        )
+
+    def test_upload_generates_smaller_webp_variants(self):
+        event = self.create_event(jpeg_upload('poster.jpg', (2000, 1200)))
+
+        srcset = self.client.get(reverse('events-list-create')).data[0]["image_srcset"]
+        self.assertEqual(set(srcset), {"320w", "640w", "1280w"})
+        self.assertTrue(srcset["640w"].endswith("poster.jpg.640w.webp"))
+
+        original_size = event.image.size
+        for width in (320, 640, 1280):
+            name = f"{event.image.name}.{width}w.webp"
+            with event.image.storage.open(name) as f, Image.open(f) as variant:
+                self.assertEqual((variant.format, variant.width), ("WEBP", width))
+            self.assertLess(event.image.storage.size(name), original_size)
+
+    def test_small_images_are_not_upscaled(self):
+        event = self.create_event(jpeg_upload('icon.jpg', (300, 300)))
+        with patch.object(FileSystemStorage, 'exists') as exists:
+            srcset = self.client.get(reverse('events-list-create')).data[0]["image_srcset"]
+        self.assertEqual(srcset, {})
+        exists.assert_not_called()
+        self.assertEqual(os.listdir(os.path.dirname(event.image.path)), ["icon.jpg"])
+
+    def test_originals_differing_only_by_extension_keep_their_own_variants(self):
+        jpeg = self.create_event(jpeg_upload('poster.jpg', (800, 600)))
+        self.create_event(png_upload('poster.png', (800, 600)))
+
+        srcsets = {row["image"].rsplit("/", 1)[-1]: row["image_srcset"]
+                   for row in self.client.get(reverse('events-list-create')).data}
+        self.assertTrue(srcsets["poster.jpg"]["640w"].endswith("poster.jpg.640w.webp"))
+        self.assertTrue(srcsets["poster.png"]["640w"].endswith("poster.png.640w.webp"))
+
+        # The JPEG's variant still shows the grey gradient, not the red PNG
+        with jpeg.image.storage.open(f"{jpeg.image.name}.640w.webp") as f, Image.open(f) as variant:
+            red, green, _ = variant.convert('RGB').getpixel((320, 10))
+            self.assertLess(abs(red - green), 16)
+
+    @override_settings(IMAGE_VARIANTS_ASYNC=True)
+    def test_variants_are_generated_in_the_pool_after_commit(self):
+        with patch('api.images.variant_executor') as executor:
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.create_event(jpeg_upload('poster.jpg', (800, 600)))
+            executor.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+        executor.return_value.submit.assert_called_once()
+
+
+class InlineImageReaperTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.settings = override_settings(MEDIA_ROOT=self.media_root, IMAGE_VARIANTS_ASYNC=False)
+        self.settings.enable()
+        self.user = User.objects.create_user(username="author", password="pass1234", email="author@example.com")
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.media_root)
+
+    def upload(self, age_hours, size=(800, 600)):
+        image = InlineImage.objects.create(image=jpeg_upload('inline.jpg', size))
+        InlineImage.objects.filter(pk=image.pk).update(uploaded_at=timezone.now() - timedelta(hours=age_hours))
+        return image
+
+    def test_reaps_only_old_unreferenced_images(self):
+        referenced = self.upload(age_hours=48)
+        variant_referenced = self.upload(age_hours=48)
+        recent = self.upload(age_hours=1)
+        orphan = self.upload(age_hours=48)
+        Blog.objects.create(
+            title="Blog", createdBy=self.user,
+            content=f'<img src="http://testserver{referenced.image.url}">'
+                    f'<img src="/media/{variant_referenced.image.name}.320w.webp">',
+        )
+        orphan_bytes = sum(os.path.getsize(os.path.join(self.media_root, 'temp_inline', name))
+                           for name in os.listdir(os.path.join(self.media_root, 'temp_inline'))
+                           if name.startswith(os.path.splitext(os.path.basename(orphan.image.name))[0]))
+
+        out = StringIO()
+        call_command('reap_inline_images', batch_size=1, stdout=out)
+
+        self.assertEqual(set(InlineImage.objects.values_list('id', flat=True)),
+                         {referenced.id, variant_referenced.id, recent.id})
+        self.assertFalse(os.path.exists(orphan.image.path))
+        self.assertTrue(os.path.exists(referenced.image.path))
+        self.assertIn(f"Deleted 1 unreferenced inline image(s), reclaiming {orphan_bytes} bytes.", out.getvalue())
+
+    def test_dry_run_deletes_nothing(self):
+        orphan = self.upload(age_hours=48)
+        out = StringIO()
+        call_command('reap_inline_images', dry_run=True, stdout=out)
+        self.assertTrue(InlineImage.objects.filter(pk=orphan.pk).exists())
+        self.assertTrue(os.path.exists(orphan.image.path))
+        self.assertIn("Would delete 1", out.getvalue())
+
+
+class BlogImageAttachBenchmarkTests(APITestCase):
+    STORAGE_LATENCY = 0.05  # seconds per file write, roughly an object-storage PUT
+
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.settings = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings.enable()
+        self.user = User.objects.create_user(username="author", password="pass1234", email="author@example.com")
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.media_root)
+
+    def post_blog(self, image_count):
+        images = [jpeg_upload(f'photo{i}.jpg', (64, 64)) for i in range(image_count)]
+        data = {"title": "Gallery", "content": "Ten photos", "images": images}
+        return self.client.post(reverse('blog-upload'), data, format='multipart')
+
+    def test_ten_image_post_writes_concurrently_and_inserts_once(self):
+        original_save = FileSystemStorage._save
+
+        def slow_save(storage, name, content):
+            sleep(self.STORAGE_LATENCY)
+            return original_save(storage, name, content)
+
+        with patch.object(FileSystemStorage, '_save', slow_save), \
+                CaptureQueriesContext(connection) as queries:
+            started = perf_counter()
+            response = self.post_blog(10)
+            elapsed = perf_counter() - started
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["data"]["images"]), 10)
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "api_blogimage"')]
+        self.assertEqual(len(inserts), 1)
+        # Written one after another, the ten files alone would take 10 * STORAGE_LATENCY
+        self.assertLess(elapsed, 10 * self.STORAGE_LATENCY * 0.6)
+
+    def test_failed_write_leaves_no_files_or_rows(self):
+        original_save = FileSystemStorage._save
+
+        def failing_save(storage, name, content):
+            if name.endswith('photo3.jpg'):
+                raise OSError("disk full")
+            return original_save(storage, name, content)
+
+        with patch.object(FileSystemStorage, '_save', failing_save), self.assertRaises(OSError):
+            self.post_blog(5)
+
+        self.assertFalse(Blog.objects.exists())
+        self.assertFalse(BlogImage.objects.exists())
+        blog_dirs = os.path.join(self.media_root, 'blog_images')
+        self.assertEqual([name for _, _, files in os.walk(blog_dirs) for name in files], [])
+
+
+class BlogImageFileDeletionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.settings = override_settings(MEDIA_ROOT=self.media_root, IMAGE_VARIANTS_ASYNC=False)
+        self.settings.enable()
+        self.user = User.objects.create_user(username="author", password="pass1234", email="author@example.com")
+        self.blog = Blog.objects.create(title="Blog", content="Some content", createdBy=self.user)
+        self.images = BlogImage.objects.attach(
+            self.blog, [jpeg_upload(f'photo{i}.jpg', (800, 600)) for i in range(3)]
+        )
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.media_root)
+
+    def files(self):
+        return sorted(name for _, _, files in os.walk(self.media_root) for name in files)
+
+    def test_files_are_deleted_after_commit_with_their_variants(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            BlogImage.objects.filter(pk=self.images[0].pk).delete()
+        # Nothing is touched until the transaction commits
+        self.assertIn("photo0.jpg", self.files())
+
+        for callback in callbacks:
+            callback()
+        file_deletion_queue.join()
+        self.assertFalse([name for name in self.files() if name.startswith("photo0")])
+        self.assertIn("photo1.jpg", self.files())
+
+    def test_deleting_a_blog_removes_all_its_files(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.blog.delete()
+        file_deletion_queue.join()
+        self.assertEqual(self.files(), [])
+
+    def test_reconcile_deletes_only_orphaned_files(self):
+        # Rows removed without signals, e.g. by raw SQL, leave their files behind
+        BlogImage.objects.filter(pk=self.images[0].pk)._raw_delete(connection.alias)
+
+        out = StringIO()
+        call_command('reconcile_blog_images', grace_minutes=-1, stdout=out)
+        # The original and its 320w and 640w variants
+        self.assertIn("Deleted 3 orphaned file(s)", out.getvalue())
+        self.assertEqual(self.files(), [
+            "photo1.jpg", "photo1.jpg.320w.webp", "photo1.jpg.640w.webp", "photo2.jpg", "photo2.jpg.320w.webp",
+            "photo2.jpg.640w.webp"
+        ])
+
+        out = StringIO()
+        call_command('reconcile_blog_images', grace_minutes=-1, stdout=out)
+        self.assertIn("Deleted 0 orphaned file(s)", out.getvalue())
+
+    def test_files_of_a_sibling_with_another_extension_are_kept(self):
+        BlogImage.objects.attach(self.blog, [png_upload(f'photo{i}.png', (800, 600)) for i in range(2)])
+
+        def photo_files(prefix):
+            return [name for name in self.files() if name.startswith(prefix)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BlogImage.objects.filter(pk=self.images[0].pk).delete()
+        file_deletion_queue.join()
+        self.assertEqual(photo_files("photo0"), ["photo0.png", "photo0.png.320w.webp", "photo0.png.640w.webp"])
+
+        # photo1.png still owns a "photo1" file, but not photo1.jpg's
+        BlogImage.objects.filter(pk=self.images[1].pk)._raw_delete(connection.alias)
+        out = StringIO()
+        call_command('reconcile_blog_images', grace_minutes=-1, stdout=out)
+        self.assertIn("Deleted 3 orphaned file(s)", out.getvalue())
+        self.assertEqual(photo_files("photo1"), ["photo1.png", "photo1.png.320w.webp", "photo1.png.640w.webp"])
+
+
+def application_payload(session, i):
+    return {
+        "recruitment_session": session.pk,
+        "personal_info": {
+            "first_name": "Applicant", "last_name": str(i), "email": f"applicant{i}@example.com",
+            "phone_number": f"+92300{i:07}",
+        },
+        "academic_info": {
+            "program": "BSCS", "current_semester": 3, "skills": ["python"], "reg_no": f"FA24-BCS-{i:03}",
+        },
+        "role_preferences": {
+            "preferred_role": Role.CODEHUB, "secondary_role": Role.GRAPHICS, "join_purpose": "To learn",
+            "weekly_availability": "10 hours",
+        },
+    }
+
+
+def create_open_session():
+    today = timezone.now().date()
+    return RecruitmentSession.objects.create(
+        uni_session="FA24",
+        application_start=today - timedelta(days=1),
+        application_end=today + timedelta(days=1),
+        interview_start=today + timedelta(days=2),
+        interview_end=today + timedelta(days=3),
+        result_date=today + timedelta(days=4),
+    )
+
+
+class ApplicationSubmissionTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('submit-application')
+        self.session = create_open_session()
+
+    def test_response_is_built_without_re_fetching(self):
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, application_payload(self.session, 1), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["personal_info"]["email"], "applicant1@example.com")
+        self.assertEqual(response.data["academic_info"]["skills"], ["python"])
+
+        statements = [q['sql'].split()[0] for q in queries.captured_queries]
+        # Looking up the session, the four INSERTs, then one search vector rebuild on commit
+        self.assertEqual(statements.count("SELECT"), 1)
+        self.assertEqual(statements.count("INSERT"), 4)
+        self.assertEqual(statements.count("UPDATE"), 1)
+
+    def test_failed_insert_leaves_no_partial_application(self):
+        with patch.object(RolePreferences.objects, 'create', side_effect=DatabaseError("connection lost")), \
+                self.assertRaises(DatabaseError):
+            self.client.post(self.url, application_payload(self.session, 1), format='json')
+        self.assertFalse(RecruitmentApplication.objects.exists())
+        self.assertFalse(PersonalInfo.objects.exists())
+
+
+class ApplicationSubmissionLoadTests(APITransactionTestCase):
+    """ Opening-day burst: many applicants submitting at the same moment. """
+    CLIENTS = 10
+    SUBMISSIONS_PER_CLIENT = 5
+
+    def setUp(self):
+        self.url = reverse('submit-application')
+        self.session = create_open_session()
+
+    def test_burst_of_submissions(self):
+        results = []
+        barrier = threading.Barrier(self.CLIENTS)
+
+        def applicant(client_id):
+            try:
+                client = APIClient()
+                barrier.wait()
+                for n in range(self.SUBMISSIONS_PER_CLIENT):
+                    i = client_id * self.SUBMISSIONS_PER_CLIENT + n
+                    started = perf_counter()
+                    response = client.post(self.url, application_payload(self.session, i), format='json')
+                    results.append((response.status_code, perf_counter() - started))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=applicant, args=(i,)) for i in range(self.CLIENTS)]
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - started
+
+        total = self.CLIENTS * self.SUBMISSIONS_PER_CLIENT
+        self.assertEqual([code for code, _ in results], [status.HTTP_201_CREATED] * total)
+        for model in (RecruitmentApplication, PersonalInfo, AcademicInfo, RolePreferences):
+            self.assertEqual(model.objects.count(), total)
+
+        latencies = sorted(latency for _, latency in results)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        # Generous bound: catches lock contention or per-row round trips creeping back in
+        self.assertLess(p95, 2.0, f"{total} submissions in {elapsed:.2f}s, p95 {p95 * 1000:.0f} ms")
+
+
+class BulkApplicationStatusTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('application-status-bulk-update-status')
+        self.session = create_open_session()
+        self.applications = seed_applications(self.session, 300, status=ApplicationStatus.UNDER_REVIEW)
+
+    def test_moves_listed_applications_in_one_update(self):
+        ids = [app.id for app in self.applications]
+        RecruitmentApplication.objects.filter(id=ids[0]).update(status=ApplicationStatus.INTERVIEWS)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                self.url, {"status": ApplicationStatus.INTERVIEWS, "ids": ids + [999999]}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["updated"], 299)
+        results = {row["id"]: row["result"] for row in response.data["data"]["results"]}
+        self.assertEqual(results[ids[0]], "unchanged")
+        self.assertEqual(results[ids[1]], "updated")
+        self.assertEqual(results[999999], "not_found")
+
+        updates = [q for q in queries.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            RecruitmentApplication.objects.filter(status=ApplicationStatus.INTERVIEWS).count(), 300
+        )
+
+    def test_moves_applications_matching_review_filters(self):
+        RecruitmentApplication.objects.filter(id__in=[app.id for app in self.applications[:100]]) \
+            .update(status=ApplicationStatus.REJECTED)
+
+        response = self.client.patch(
+            f"{self.url}?status={ApplicationStatus.UNDER_REVIEW}&recruitment_session={self.session.id}",
+            {"status": ApplicationStatus.INTERVIEWS}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["updated"], 200)
+        self.assertEqual(
+            RecruitmentApplication.objects.filter(status=ApplicationStatus.REJECTED).count(), 100
+        )
+
+    def test_rejects_invalid_status_and_unscoped_requests(self):
+        response = self.client.patch(self.url, {"status": "HIRED", "ids": [self.applications[0].id]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.patch(self.url, {"status": ApplicationStatus.ACCEPTED}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(RecruitmentApplication.objects.filter(status=ApplicationStatus.ACCEPTED).exists())
+
+
+class RecruitmentStatsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.session = create_open_session()
+        self.applications = seed_applications(self.session, 40, status=ApplicationStatus.UNDER_REVIEW)
+        AcademicInfo.objects.filter(application=self.applications[0]).update(skills=[" Python ", "Figma"])
+        self.url = reverse('recruitment-sessions-stats', args=[self.session.id])
+
+    def test_breakdowns_are_computed_in_grouped_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(len(queries), 6)
+
+        data = response.data["data"]
+        self.assertEqual(data["session"], "FA24")
+        self.assertEqual(data["total"], 40)
+        self.assertEqual(data["by_status"][ApplicationStatus.UNDER_REVIEW], 40)
+        self.assertEqual(data["by_status"][ApplicationStatus.ACCEPTED], 0)
+        self.assertEqual(data["by_program"]["BSCS"], 40)
+        self.assertEqual(sum(data["by_semester"].values()), 40)
+        self.assertEqual(data["by_preferred_role"][Role.CODEHUB], 40)
+        self.assertEqual(data["skills"][0], {"skill": "python", "count": 40})
+        self.assertIn({"skill": "figma", "count": 1}, data["skills"])
+
+    def test_stats_are_cached_until_an_application_changes(self):
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        # Only the session lookup
+        self.assertEqual(len(queries), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse('application-status-bulk-update-status'),
+                {"status": ApplicationStatus.INTERVIEWS, "ids": [self.applications[0].id]}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = self.client.get(self.url).data["data"]
+        self.assertEqual(data["by_status"][ApplicationStatus.INTERVIEWS], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            seed_applications(self.session, 1)
+            RecruitmentApplication.objects.create(recruitment_session=self.session)
+        self.assertEqual(self.client.get(self.url).data["data"]["total"], 42)
+
+    def test_unknown_session_leaves_nothing_in_the_cache(self):
+        response = self.client.get(reverse('recruitment-sessions-stats', args=[999999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIsNone(cache.get("applications-999999-version"))
+
+
+class ApplicationReviewIndexTests(APITestCase):
+    # Large enough (with skewed statuses and roles) that the planner prefers the indexes
+    SESSIONS = 10
+    PER_SESSION = 300
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        cls.sessions = RecruitmentSession.objects.bulk_create([
+            RecruitmentSession(
+                uni_session=f"FA{10 + i}", application_start=date(2024, 9, 1), application_end=date(2024, 9, 15),
+                interview_start=date(2024, 9, 20), interview_end=date(2024, 9, 25), result_date=date(2024, 10, 1)
+            )
+            for i in range(cls.SESSIONS)
+        ])
+        # Skewed like a real backlog: most applications wait for review, few are accepted
+        applications = RecruitmentApplication.objects.bulk_create([
+            RecruitmentApplication(
+                recruitment_session=session,
+                status=ApplicationStatus.ACCEPTED if i % 50 == 0 else ApplicationStatus.UNDER_REVIEW
+            )
+            for session in cls.sessions
+            for i in range(cls.PER_SESSION)
+        ], batch_size=5000)
+        PersonalInfo.objects.bulk_create([
+            PersonalInfo(
+                application=app, first_name="Applicant", last_name=str(app.id),
+                email=f"applicant{app.id}@example.com", phone_number="+923000000000"
+            )
+            for app in applications
+        ], batch_size=5000)
+        AcademicInfo.objects.bulk_create([
+            AcademicInfo(application=app, reg_no=f"FA22-BCS-{app.id:03}", current_semester=5, program="BSCS")
+            for app in applications
+        ], batch_size=5000)
+        RolePreferences.objects.bulk_create([
+            RolePreferences(
+                application=app, preferred_role=Role.DECOR if app.id % 100 == 0 else Role.CODEHUB,
+                secondary_role=Role.GRAPHICS, join_purpose="To learn", weekly_availability="10 hours"
+            )
+            for app in applications
+        ], batch_size=5000)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE api_recruitmentapplication, api_rolepreferences")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin)
+
+    def test_review_filters_use_composite_indexes(self):
+        session = self.sessions[3]
+        plan = RecruitmentApplication.objects.filter(
+            recruitment_session=session, status=ApplicationStatus.ACCEPTED
+        ).explain()
+        self.assertIn("api_recruit_recruit_be22f0_idx", plan)
+
+        plan = RecruitmentApplication.objects.filter(status=ApplicationStatus.ACCEPTED).explain()
+        self.assertIn("api_recruit_status_1dbf45_idx", plan)
+
+        plan = RecruitmentApplication.objects.filter(role_preferences__preferred_role=Role.DECOR).explain()
+        self.assertIn("api_rolepre_preferr_326aa8_idx", plan)
+
+        response = self.client.get(
+            reverse('application-review-list'),
+            {"recruitment_session": session.id, "status": ApplicationStatus.ACCEPTED}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), self.PER_SESSION // 50)
+
+    def test_status_is_an_exact_choice_filter(self):
+        response = self.client.get(reverse('application-review-list'), {"status": "REVIEW"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ApplicationSearchTests(APITestCase):
+    def setUp(self):
+        self.session = create_open_session()
+        submit_url = reverse('submit-application')
+        payloads = [application_payload(self.session, i) for i in range(1, 4)]
+        payloads[0]["personal_info"]["first_name"] = "Ayesha"
+        payloads[0]["academic_info"]["skills"] = ["React", "Figma"]
+        payloads[1]["role_preferences"]["join_purpose"] = "I want to organise hackathons and learn React"
+        payloads[2]["role_preferences"]["previous_experience"] = "Built a React Native app"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ids = [self.client.post(submit_url, payload, format='json').data["id"] for payload in payloads]
+
+        self.admin = User.objects.create_user(
+            username="admin", password="pass1234", email="admin@example.com", role=UserRole.ADMIN
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('application-review-list')
+
+    def search(self, terms, **params):
+        response = self.client.get(self.url, {"search": terms, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_finds_applications_by_identity_skills_and_answers(self):
+        self.assertEqual([row["id"] for row in self.search("ayesha")["results"]], [self.ids[0]])
+        self.assertEqual([row["id"] for row in self.search("applicant2@example.com")["results"]], [self.ids[1]])
+        self.assertEqual([row["id"] for row in self.search("FA24-BCS-003")["results"]], [self.ids[2]])
+        self.assertEqual([row["id"] for row in self.search("hackathon")["results"]], [self.ids[1]])
+        self.assertEqual(self.search("cobol")["count"], 0)
+
+    def test_results_are_ranked_and_paginated(self):
+        # A skill outranks a word in the answers
+        data = self.search("react")
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(data["results"][0]["id"], self.ids[0])
+
+        data = self.search("react", page_size=2)
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNotNone(data["next"])
+        self.assertEqual(len(self.search("react", page_size=2, page=2)["results"]), 1)
+
+        data = self.search("react -native", recruitment_session=self.session.id)
+        self.assertEqual([row["id"] for row in data["results"]], self.ids[:2])
+
+    def test_edits_are_reindexed(self):
+        info = PersonalInfo.objects.get(application_id=self.ids[2])
+        info.first_name = "Zainab"
+        with self.captureOnCommitCallbacks(execute=True):
+            info.save()
+        self.assertEqual([row["id"] for row in self.search("zainab")["results"]], [self.ids[2]])
+
+    def test_records_created_outside_the_submission_are_indexed(self):
+        application = RecruitmentApplication.objects.create(recruitment_session=self.session)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True) as callbacks:
+            PersonalInfo.objects.create(
+                application=application, first_name="Hamza", last_name="Khan",
+                email="hamza@example.com", phone_number="+923001234567"
+            )
+            AcademicInfo.objects.create(
+                application=application, reg_no="FA23-BSE-010", current_semester=4, program="BSSE", skills=["Kotlin"]
+            )
+            RolePreferences.objects.create(
+                application=application, preferred_role=Role.MEDIA, secondary_role=Role.DECOR,
+                join_purpose="Photography", weekly_availability="5 hours"
+            )
+        # The three saves share one rebuild
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual([q['sql'].split()[0] for q in queries.captured_queries].count("UPDATE"), 1)
+        self.assertEqual([row["id"] for row in self.search("hamza kotlin")["results"]], [application.id])
+
+    def test_plain_list_is_unchanged(self):
+        response = self.client.get(self.url)
+        self.assertEqual([row["id"] for row in response.data], self.ids)
+
+    def test_fallback_search_matches_text_fields(self):
+        with patch.object(connection, 'vendor', 'sqlite'):
+            found = RecruitmentApplication.objects.search("hackathons React")
+            self.assertEqual(list(found.values_list("id", flat=True)), [self.ids[1]])
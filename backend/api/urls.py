@@ -1,10 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from api.views import (
-    SignupView, OTPView, LoginView, PasswordChangeView, LogoutView,
+    SignupView, BulkSignupView, OTPView, LoginView, PasswordChangeView, LogoutView,
     BlogUploadView, BlogListAPIView, BlogEditView, BlogDeleteView,
     MeetingRUDView, MeetingCreateView, MeetingListView, MeetingAttendanceListView,
-    MeetingAttendanceRUDView, StudentsListView, StudentRUView, MeetingPDFView,
+    MeetingAttendanceRUDView, MeetingAttendanceStatsView, StudentsListView, StudentRUView, MeetingPDFView,
     api_root, AdminRUDView,
     PublicStudentsListView, BillListCreateView, BillRUDView, InlineImageUploadView,
 
@@ -15,6 +15,7 @@ from api.views import (
     ApplicationReviewViewSet,
     ApplicationStatusUpdateViewSet,
     RecruitmentApplicationsExcelView,
+    RecruitmentApplicationsExportView,
 
     # Event Views
     EventDetailView,
@@ -42,6 +43,7 @@ urlpatterns = [
 
     # Authentication
     path('auth/signup/', SignupView.as_view(), name='signup'),
+    path('auth/signup/bulk/', BulkSignupView.as_view(), name='bulk-signup'),
     path('auth/login/', LoginView.as_view(), name='login'),
     path('auth/logout', LogoutView.as_view(), name='logout'),
     path('auth/otp/', OTPView.as_view(), name='otp'),
@@ -67,6 +69,7 @@ urlpatterns = [
     path('meetings/create/', MeetingCreateView.as_view(), name='meeting.py-create'),
     path('meetings/<int:pk>/', MeetingRUDView.as_view(), name='meeting.py-RUD'),
     path('meetings/<int:pk>/attendance/', MeetingAttendanceListView.as_view(), name='attendance-list'),
+    path('meetings/<int:pk>/attendance/stats/', MeetingAttendanceStatsView.as_view(), name='attendance-stats'),
     path('meetings/<int:pk>/attendance/<int:att_pk>', MeetingAttendanceRUDView.as_view(), name='attendance-RUD'),
     path("meetings/<int:pk>/pdf/", MeetingPDFView.as_view(), name="meeting.py-pdf"),
 
@@ -84,6 +87,7 @@ urlpatterns = [
 
     # Admin Recruitment Views (via router)
     path('recruitment/', include(recruitment_router.urls)),
+    path("recruitment/export/", RecruitmentApplicationsExportView.as_view(), name='export-recruitment'),
     path("recruitment/export/excel/", RecruitmentApplicationsExcelView.as_view(), name='export-recruitment-excel'),
 
     # Events
@@ -1,7 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from django.contrib.auth.hashers import make_password
+
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.core.mail import send_mail
 
 
 def get_tokens_for_user(user, **claims):
@@ -22,30 +24,73 @@ def get_tokens_for_user(user, **claims):
         'access': str(refresh.access_token),
     }
 
+def queue_email(subject: str, message: str, recipient_list: list, from_email: str = 'no_reply@example.com'):
+    """
+    Adds an email to the outbox. It is delivered in the background by the
+    `send_queued_emails` management command, so callers never wait on the mail server.
+    """
+    from api.models import OutgoingEmail
+
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email,
+        recipients=list(recipient_list),
+    )
+
 def send_otp(destination: str, **data):
     """
-    Sends OTP to destination. This function is currently development
-    only. It uses the 'file' backend and so it will dump all emails to tmp/api_messages.
+    Queues an OTP email for destination. With the default 'file' backend the
+    worker dumps all emails to api/tmp/api_emails.
 
     :param destination: Receiver's email
     :param data: Dict containing extra data (Optional)
     """
-    send_mail(
+    queue_email(
         "OTP Verification",
         f"This is your requested OTP: {data['otp']}",
-        "no_reply@example.com",
         [destination],
-        fail_silently=False,
     )
 
+PASSWORD_NOTICE = 'Your account has been created with username: {username} and password: {password}.\nYou are advised to change the password as soon as possible.'
+
+# Below this many passwords, starting worker processes costs more than it saves
+PARALLEL_HASH_THRESHOLD = 16
+
 def send_password(destination: str, **data):
-    send_mail(
+    queue_email(
         subject='Account Creation Notice',
-        message=f'Your account has been created with username: {data["username"]} and password: {data["password"]}.\nYou are advised to change the password as soon as possible.',
-        from_email='no_reply@example.com',
+        message=PASSWORD_NOTICE.format(username=data["username"], password=data["password"]),
         recipient_list=[destination],
-        fail_silently=False,
     )
 
+def send_passwords(accounts):
+    """
+    Queues account creation notices for many users with a single INSERT.
+
+    :param accounts: Iterable of (destination, username, password) tuples
+    """
+    from api.models import OutgoingEmail
+
+    OutgoingEmail.objects.bulk_create([
+        OutgoingEmail(
+            subject='Account Creation Notice',
+            message=PASSWORD_NOTICE.format(username=username, password=password),
+            from_email='no_reply@example.com',
+            recipients=[destination],
+        )
+        for destination, username, password in accounts
+    ])
+
+def hash_passwords(passwords: list) -> list:
+    """
+    Hashes a batch of raw passwords, preserving order. Hashing is deliberately
+    CPU-bound, so large batches are spread over a process pool.
+    """
+    if len(passwords) < PARALLEL_HASH_THRESHOLD:
+        return [make_password(password) for password in passwords]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(make_password, passwords, chunksize=8))
+
 def current_time():
     return datetime.now().time()
\ No newline at end of file
@@ -1,11 +1,12 @@
 from .admin import AdminRUDView
-from .auth import SignupView, OTPView, LoginView, LogoutView, PasswordChangeView
+from .auth import SignupView, BulkSignupView, OTPView, LoginView, LogoutView, PasswordChangeView
 from .bill import BillRUDView, BillListCreateView
 from .blog import BlogEditView, BlogDeleteView, BlogUploadView, InlineImageUploadView, BlogListAPIView
 from .event import EventDetailView, EventTypeListCreateView, EventListCreateView, EventRegistrationListCreateView, RegistrationStatusUpdateView, EventRegistrationDeleteView, EventRegistrationDetailView
 from .meeting import MeetingPDFView, MeetingListView, MeetingRUDView, MeetingCreateView, MeetingAttendanceRUDView, \
-    MeetingAttendanceListView
+    MeetingAttendanceListView, MeetingAttendanceStatsView
 from .root import api_root
 from .user import StudentRUView, StudentsListView, PublicStudentsListView
 from .recruitment import RecruitmentSessionViewSet, ApplicationReviewViewSet, ApplicationStatusUpdateViewSet, \
-    ApplicationSubmitView, ActiveRecruitmentSessionView, RecruitmentApplicationsExcelView
\ No newline at end of file
+    ApplicationSubmitView, ActiveRecruitmentSessionView, RecruitmentApplicationsExcelView, \
+    RecruitmentApplicationsExportView
\ No newline at end of file
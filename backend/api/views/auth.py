@@ -1,14 +1,20 @@
+import csv
+import io
+import json
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ParseError, PermissionDenied
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import UntypedToken
-from api.permissions import SignUpPermission
-from api.serializers import StudentSerializer, LoginSerializer, OTPSerializer, PasswordChangeSerializer
+from api.permissions import SignUpPermission, IsLeadOrAdmin, LEAD, ADMIN
+from api.serializers import StudentSerializer, LoginSerializer, OTPSerializer, PasswordChangeSerializer, \
+    StudentBulkImportSerializer
 from api.utils import get_tokens_for_user, send_otp
 from api.utils import send_password
 
@@ -89,6 +95,92 @@ class SignupView(APIView):
         }, status=status.HTTP_400_BAD_REQUEST)
 
 
+def read_import_file(upload):
+    """ Reads the rows of an uploaded CSV or JSON import file as a list of dicts. """
+    if upload.name.lower().endswith('.json') or upload.content_type == 'application/json':
+        try:
+            rows = json.load(upload)
+        except ValueError as e:
+            raise ParseError(f"Invalid JSON file: {e}")
+        return rows.get('students', []) if isinstance(rows, dict) else rows
+
+    try:
+        reader = csv.DictReader(io.TextIOWrapper(upload, encoding='utf-8-sig'))
+        # Blank cells fall back to the serializer defaults, like omitted JSON keys
+        return [{key: value for key, value in row.items() if key and value not in ('', None)} for row in reader]
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ParseError(f"Invalid CSV file: {e}")
+
+
+@extend_schema(
+    request={
+        'multipart/form-data': {
+            'type': 'object',
+            'properties': {'file': {'type': 'string', 'format': 'binary'}},
+        },
+        'application/json': StudentBulkImportSerializer,
+    },
+    responses={
+        201: OpenApiResponse(description="All students imported"),
+        400: OpenApiResponse(description="Validation errors, listed per row; nothing is imported"),
+        403: OpenApiResponse(description="Forbidden - not a Lead/Admin, or a Lead importing another club"),
+    },
+    description=(
+        "Registers many students at once from a CSV/JSON file upload (`file`) or a JSON body "
+        "(`{\"students\": [...]}`). Rows use the flat fields username, email, first_name, last_name, "
+        "phone_number, password, role, roll_no, club and title. All rows are validated before anything "
+        "is written, and the import either succeeds completely or not at all."
+    ),
+)
+class BulkSignupView(APIView):
+    permission_classes = [IsLeadOrAdmin]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
+    serializer_class = StudentBulkImportSerializer
+
+    def post(self, request):
+        if request.user.role not in (LEAD, ADMIN):
+            raise PermissionDenied('Only leads and admins can register users.')
+
+        upload = request.FILES.get('file')
+        rows = read_import_file(upload) if upload else request.data.get('students')
+        serializer = self.serializer_class(
+            data={'students': rows}, context={'default_password': DEFAULT_PASSWORD}
+        )
+        if not serializer.is_valid():
+            return Response({
+                'status': 'error',
+                'message': serializer.errors,
+                'data': None
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if request.user.role == LEAD:
+            # A lead without a student profile has no club to register users for
+            if not hasattr(request.user, 'student'):
+                raise PermissionDenied('Leads need a student profile to register users.')
+            club = request.user.student.club
+            if any(row['club'] != club for row in serializer.validated_data['students']):
+                raise PermissionDenied('Registering users of another club is not allowed.')
+
+        created = serializer.save()
+        return Response({
+            'status': 'success',
+            'message': f'{len(created)} students registered successfully',
+            'data': [
+                {
+                    "token": token.key,
+                    "user_id": student.user.id,
+                    "username": student.user.username,
+                    "email": student.user.email,
+                    "role": student.user.role,
+                    "club": student.club,
+                    "roll_number": student.roll_no,
+                    "title": student.title,
+                }
+                for student, token in created
+            ]
+        }, status=status.HTTP_201_CREATED)
+
+
 @extend_schema(
     request=LoginSerializer,
     responses={
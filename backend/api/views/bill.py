@@ -1,5 +1,6 @@
 from rest_framework import generics
 from api.models import Bill
+from api.pagination import DateCursorPagination
 from api.serializers import BillSerializer
 from api.permissions import IsTreasurer
 
@@ -8,6 +9,7 @@ class BillListCreateView(generics.ListCreateAPIView):
     queryset = Bill.objects.all()
     serializer_class = BillSerializer
     permission_classes = [IsTreasurer]
+    pagination_class = DateCursorPagination
 
 
 class BillRUDView(generics.RetrieveUpdateDestroyAPIView):
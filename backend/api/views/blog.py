@@ -6,7 +6,9 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from api.cache import CachedResponseMixin
 from api.models import Blog
+from api.pagination import CreatedAtCursorPagination
 from api.permissions import IsAdmin
 from api.serializers import BlogSerializer, BlogUploadSerializer, BlogUpdateSerializer, InlineImageSerializer
 
@@ -159,7 +161,9 @@ class BlogUploadView(APIView):
             "- **student_id** (optional, int): Filter blog posts by the ID of the student who created them.\n\n"
             "Returns all blog posts by default, ordered by creation date (newest first). "
             "If `student_id` is provided, only posts from that student are included. "
-            "If `limit` is provided, restricts the number of results."
+            "If `limit` is provided, restricts the number of results.\n\n"
+            "Passing `cursor` or `page_size` switches to cursor pagination: the response becomes "
+            "`{next, previous, results}` and `limit` is ignored."
     ),
     parameters=[
         OpenApiParameter(
@@ -186,18 +190,23 @@ class BlogUploadView(APIView):
         403: OpenApiResponse(description="Permission denied."),
     }
 )
-class BlogListAPIView(generics.ListAPIView):
+class BlogListAPIView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = BlogSerializer
+    pagination_class = CreatedAtCursorPagination
+    # Blogs embed their author's username
+    response_cache_groups = ('blogs', 'members')
 
     def get_queryset(self):
-        queryset = Blog.objects.all().order_by('-createdAt')
+        # BlogSerializer reads the author and images of every blog, so load them up front
+        queryset = Blog.objects.select_related('createdBy').prefetch_related('images').order_by('-createdAt')
 
         student_id = self.request.query_params.get('student_id')
         if student_id:
             queryset = queryset.filter(createdBy__id=student_id)
 
+        # A sliced queryset can't be paginated, so `limit` only applies to unpaginated lists
         limit = self.request.query_params.get('limit')
-        if limit and limit.isdigit():
+        if limit and limit.isdigit() and not self.paginator.is_requested(self.request):
             queryset = queryset[:int(limit)]
 
         return queryset
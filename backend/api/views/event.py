@@ -1,5 +1,8 @@
+from django.db import transaction
 from rest_framework import generics
+from api.cache import CachedResponseMixin
 from api.models import Event, EventType, EventRegistration, EventParticipant, RegistrationType, RegistrationStatus
+from api.pagination import DateCursorPagination
 from api.serializers import (
     EventSerializer,
     EventWriteSerializer,
@@ -12,8 +15,10 @@ from api.serializers import (
 )
 
 
-class EventListCreateView(generics.ListCreateAPIView):
-    queryset = Event.objects.select_related('event_type')
+class EventListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
+    queryset = Event.objects.select_related('event_type').with_registration_stats()
+    pagination_class = DateCursorPagination
+    response_cache_groups = ('events',)
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -22,7 +27,7 @@ class EventListCreateView(generics.ListCreateAPIView):
 
 
 class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Event.objects.select_related('event_type')
+    queryset = Event.objects.select_related('event_type').with_registration_stats()
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -30,9 +35,10 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
         return EventSerializer
 
 
-class EventTypeListCreateView(generics.ListCreateAPIView):
+class EventTypeListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
     queryset = EventType.objects.all()
     serializer_class = EventTypeSerializer
+    response_cache_groups = ('events',)
 
 
 class RegistrationStatusUpdateView(generics.UpdateAPIView):
@@ -55,4 +61,14 @@ class EventRegistrationDetailView(generics.RetrieveAPIView):
 
 
 class EventRegistrationDeleteView(generics.DestroyAPIView):
-    queryset = EventRegistration.objects.all()
\ No newline at end of file
+    queryset = EventRegistration.objects.all()
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        # Lock the row so the seat is released exactly once, even under concurrent deletes
+        registration = EventRegistration.objects.select_for_update().filter(pk=instance.pk).first()
+        if registration is None:
+            return
+        registration.delete()
+        if registration.status != RegistrationStatus.CANCELLED:
+            Event.objects.release_seat(registration.event_id)
@@ -1,6 +1,10 @@
-from datetime import datetime
+import hashlib
+from functools import lru_cache
 from io import BytesIO
+from django.core.cache import cache
 from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -8,57 +12,37 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from rest_framework import generics
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import NotFound
+from api.authentication import CachedTokenAuthentication
+from api.cache import meeting_version, members_version
 from api.models import Meeting, MeetingAttendance
+from api.pagination import DateCursorPagination, IdCursorPagination
 from api.permissions import IsLeadOrAdmin
 from api.serializers import MeetingSerializer, \
-    MeetingAttendanceSerializer
+    MeetingAttendanceSerializer, MeetingCreateSerializer
 import os
 from django.conf import settings
 from reportlab.lib.utils import ImageReader
 
 
 class MeetingCreateView(APIView):
-    serializer_class = MeetingSerializer
+    serializer_class = MeetingCreateSerializer
     permission_classes = [IsLeadOrAdmin]
 
     def post(self, request, *args, **kwargs):
-        data = request.data
-        try:
-            attendance_data = data.pop('attendance')
-        except KeyError:
+        serializer = self.serializer_class(data=request.data)
+        if serializer.is_valid():
+            serializer.save()
             return Response({
-                'status': 'error',
-                'message': {
-                    'attendance': 'This field is required.'
-                },
-                'data': None
-            }, status.HTTP_400_BAD_REQUEST)
-        meeting_serializer = self.serializer_class(data=data)
-        if meeting_serializer.is_valid():
-            meeting = meeting_serializer.save()
-            for att in attendance_data:
-                att['meeting'] = meeting.id
-            attendance_serializer = MeetingAttendanceSerializer(many=True, data=attendance_data)
-            if attendance_serializer.is_valid():
-                attendance_serializer.save()
-                return Response({
-                    'status': 'success',
-                    'message': 'Data created',
-                    'data': None
-                }, status.HTTP_201_CREATED)
-            else:
-                return Response({
-                'status': 'error',
-                'message': attendance_serializer.errors,  
+                'status': 'success',
+                'message': 'Data created',
                 'data': None
-            }, status.HTTP_400_BAD_REQUEST)
+            }, status.HTTP_201_CREATED)
         return Response({
             'status': 'error',
-            'message': meeting_serializer.errors,
+            'message': serializer.errors,
             'data': None
         }, status.HTTP_400_BAD_REQUEST)
 
@@ -67,6 +51,7 @@ class MeetingListView(generics.ListAPIView):
     queryset = Meeting.objects.all()
     serializer_class = MeetingSerializer
     permission_classes = [IsLeadOrAdmin]
+    pagination_class = DateCursorPagination
 
 
 class MeetingRUDView(generics.RetrieveUpdateDestroyAPIView):
@@ -78,6 +63,7 @@ class MeetingRUDView(generics.RetrieveUpdateDestroyAPIView):
 class MeetingAttendanceListView(generics.ListAPIView):
     serializer_class = MeetingAttendanceSerializer
     permission_classes = [IsLeadOrAdmin]
+    pagination_class = IdCursorPagination
     lookup_url_kwarg = 'pk'
 
     def get_queryset(self):
@@ -87,6 +73,28 @@ class MeetingAttendanceListView(generics.ListAPIView):
         return MeetingAttendance.objects.all()
 
 
+class MeetingAttendanceStatsView(APIView):
+    permission_classes = [IsLeadOrAdmin]
+
+    def get(self, request, pk, *args, **kwargs):
+        if not Meeting.objects.filter(pk=pk).exists():
+            return Response(
+                {"status": "error", "message": "Meeting not found", "data": None},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        attendance = MeetingAttendance.objects.filter(meeting_id=pk)
+        student = getattr(request.user, 'student', None)
+        if request.user.role == 'LEAD' and student:
+            attendance = attendance.filter(user__student__club=student.club)
+
+        return Response({
+            "status": "success",
+            "message": "Attendance statistics retrieved",
+            "data": attendance.status_counts()
+        }, status=status.HTTP_200_OK)
+
+
 class MeetingAttendanceRUDView(generics.RetrieveUpdateDestroyAPIView):
     queryset = MeetingAttendance.objects.all()
     serializer_class = MeetingAttendanceSerializer
@@ -94,44 +102,16 @@ class MeetingAttendanceRUDView(generics.RetrieveUpdateDestroyAPIView):
     lookup_url_kwarg = 'att_pk'
 
 
-class MeetingPDFView(APIView):
-    authentication_classes = [TokenAuthentication]
-    permission_classes = [IsLeadOrAdmin]
+# Rendered minutes are cached per meeting, requester scope and content version (seconds)
+MEETING_PDF_CACHE_TIMEOUT = getattr(settings, "MEETING_PDF_CACHE_TIMEOUT", 60 * 60 * 24)
 
-    def get(self, request, pk, *args, **kwargs):
-        try:
-            meeting = Meeting.objects.get(pk=pk)
-        except Meeting.DoesNotExist:
-            return Response(
-                {"status": "error", "message": "Meeting not found"},
-                status=status.HTTP_404_NOT_FOUND
-            )
 
-        if request.user.role == 'LEAD' and hasattr(request.user, 'student'):
-            club = request.user.student.club
-            attendance = MeetingAttendance.objects.filter(
-                meeting=meeting,
-                user__student__club=club
-            ).select_related('user')
-        else:
-            attendance = MeetingAttendance.objects.filter(
-                meeting=meeting
-            ).select_related('user')
-
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=120,
-            bottomMargin=40
-        )
-
-        styles = getSampleStyleSheet()
-        elements = []
-
-        title_style = ParagraphStyle(
+@lru_cache(maxsize=None)
+def pdf_styles():
+    """ Paragraph styles for the meeting minutes, built once per process. """
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
             'Title',
             parent=styles['Heading1'],
             fontName='Helvetica-Bold',
@@ -139,73 +119,98 @@ class MeetingPDFView(APIView):
             alignment=1,
             textColor=colors.HexColor('#2c3e50'),
             spaceAfter=20
-        )
-
-        heading_style = ParagraphStyle(
+        ),
+        'heading': ParagraphStyle(
             'Heading',
             parent=styles['Heading2'],
             fontName='Helvetica-Bold',
             fontSize=12,
             textColor=colors.HexColor('#34495e'),
             spaceAfter=10
-        )
-
-        body_style = ParagraphStyle(
+        ),
+        'body': ParagraphStyle(
             'Body',
             parent=styles['Normal'],
             fontSize=10,
             leading=14,
             textColor=colors.HexColor('#2c3e50')
-        )
-
-        cell_style = ParagraphStyle(
+        ),
+        'cell': ParagraphStyle(
             'Cell',
             parent=styles['Normal'],
             fontSize=10,
             leading=14,
-            wordWrap='CJK',  
+            wordWrap='CJK',
             textColor=colors.HexColor('#2c3e50')
-        )
-
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=8,
-            alignment=1,
-            textColor=colors.HexColor('#7f8c8d')
-        )
-
-        elements.append(Paragraph("Minutes of ACM Meeting", title_style))
-
-        if request.user.role != 'ADMIN' and hasattr(request.user, 'student'):
-            club_name = request.user.student.club.replace('_', ' ').title()
-            elements.append(Paragraph(f"{club_name} Meeting Minutes", heading_style))
-
-        elements.append(Spacer(1, 0.2 * inch))
-
-        def to_12h(t):
-            return t.strftime('%I:%M %p') if t else "N/A"
-        def format_multiline_text(text):
-            if not text:
-                return "Not specified"
-
-            lines = text.splitlines()
-            formatted_lines = []
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith(('-', '*')):
-                    formatted_lines.append(f"• {line[1:].strip()}")
-                elif line.startswith('•'):
-                    formatted_lines.append(line)
-                else:
-                    formatted_lines.append(line)
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def acm_logo():
+    """ The ACM logo read from disk once per process, or None if it is missing. """
+    logo_path = os.path.join(
+        settings.BASE_DIR,
+        'assets',
+        'acm_logo.png'
+    )
+    if os.path.isfile(logo_path):
+        return ImageReader(logo_path)
+    return None
+
+
+def render_meeting_minutes(meeting, attendance, club_name=None):
+    """
+    Renders the minutes of a meeting with its attendance records as a PDF.
+
+    :param meeting: The Meeting instance
+    :param attendance: MeetingAttendance queryset to list
+    :param club_name: Adds a club heading when given
+    :return: The PDF document as bytes
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=120,
+        bottomMargin=40
+    )
+
+    styles = pdf_styles()
+    cell_style = styles['cell']
+    heading_style = styles['heading']
+    elements = []
+
+    elements.append(Paragraph("Minutes of ACM Meeting", styles['title']))
+
+    if club_name:
+        elements.append(Paragraph(f"{club_name} Meeting Minutes", heading_style))
+
+    elements.append(Spacer(1, 0.2 * inch))
+
+    def format_multiline_text(text):
+        if not text:
+            return "Not specified"
+
+        lines = text.splitlines()
+        formatted_lines = []
+
+        for line in lines:
+            line = line.strip()
+            if line.startswith(('-', '*')):
+                formatted_lines.append(f"• {line[1:].strip()}")
+            elif line.startswith('•'):
+                formatted_lines.append(line)
+            else:
+                formatted_lines.append(line)
 
-            return "<br/>".join(formatted_lines)
-        def t12(time_obj):
-            return time_obj.strftime('%I:%M %p') if time_obj else "N/A"
+        return "<br/>".join(formatted_lines)
+    def t12(time_obj):
+        return time_obj.strftime('%I:%M %p') if time_obj else "N/A"
 
-        meeting_data = [
+    meeting_data = [
         ["Date:", Paragraph(str(meeting.date), cell_style)],
         ["Time:", Paragraph(f"{t12(meeting.start_time)} - {t12(meeting.end_time)}", cell_style)],
         ["Venue:", Paragraph(meeting.venue or "N/A", cell_style)],
@@ -213,116 +218,153 @@ class MeetingPDFView(APIView):
         ["Highlights:", Paragraph(format_multiline_text(meeting.highlights), cell_style)],
     ]
 
-
-        meeting_table = Table(
-            meeting_data,
-            colWidths=[1.4 * inch, doc.width - 1.4 * inch]
-        )
-
-        meeting_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dcdcdc')),
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f3f5')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        elements.append(meeting_table)
-        elements.append(Spacer(1, 0.3 * inch))
-
-        elements.append(Paragraph("Attendance Record", heading_style))
-
-        attendance_data = [["Name", "Roll No", "Status"]]
-        for record in attendance:
-            roll = getattr(record.user.student, 'roll_no', "N/A") if hasattr(record.user, 'student') else "N/A"
-            attendance_data.append([
-                record.user.get_full_name(),
-                roll,
-                record.status
-            ])
-
-        attendance_table = Table(
-            attendance_data,
-            colWidths=[2.8 * inch, 1.5 * inch, 1.2 * inch]
-        )
-
-        attendance_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ]))
-
-        elements.append(attendance_table)
-        elements.append(Spacer(1, 0.3 * inch))
-
-        summary = (
-            f"<b>Summary:</b> "
-            f"Present: {attendance.filter(status='PRESENT').count()}, "
-            f"Absent: {attendance.filter(status='ABSENT').count()}, "
-            f"Leave: {attendance.filter(status='LEAVE').count()}, "
-            f"Total: {attendance.count()}"
-        )
-
-        elements.append(Paragraph(summary, body_style))
-        elements.append(Spacer(1, 0.4 * inch))
-
-        elements.append(Paragraph(
-            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            footer_style
-        ))
-
-        def add_header(canvas, doc):
-            canvas.saveState()
-            width, height = doc.pagesize
-
-            canvas.setFillColor(colors.white)
-            canvas.rect(0, height - 1.2 * inch, width, 1.2 * inch, fill=1, stroke=0)
-
-            logo_path = os.path.join(
-                settings.BASE_DIR,
-                'assets',
-                'acm_logo.png'
+    meeting_table = Table(
+        meeting_data,
+        colWidths=[1.4 * inch, doc.width - 1.4 * inch]
+    )
+
+    meeting_table.setStyle(TableStyle([
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dcdcdc')),
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f3f5')),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]))
+    elements.append(meeting_table)
+    elements.append(Spacer(1, 0.3 * inch))
+
+    elements.append(Paragraph("Attendance Record", heading_style))
+
+    attendance_data = [["Name", "Roll No", "Status"]]
+    for record in attendance:
+        roll = getattr(record.user.student, 'roll_no', "N/A") if hasattr(record.user, 'student') else "N/A"
+        attendance_data.append([
+            record.user.get_full_name(),
+            roll,
+            record.status
+        ])
+
+    attendance_table = Table(
+        attendance_data,
+        colWidths=[2.8 * inch, 1.5 * inch, 1.2 * inch]
+    )
+
+    attendance_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
+    ]))
+
+    elements.append(attendance_table)
+    elements.append(Spacer(1, 0.3 * inch))
+
+    counts = attendance.status_counts()
+    summary = (
+        f"<b>Summary:</b> "
+        f"Present: {counts['present']}, "
+        f"Absent: {counts['absent']}, "
+        f"Leave: {counts['leave']}, "
+        f"Total: {counts['total']}"
+    )
+
+    elements.append(Paragraph(summary, styles['body']))
+
+    def add_header(canvas, doc):
+        canvas.saveState()
+        width, height = doc.pagesize
+
+        canvas.setFillColor(colors.white)
+        canvas.rect(0, height - 1.2 * inch, width, 1.2 * inch, fill=1, stroke=0)
+
+        logo_x = 50
+        logo_width = 0
+
+        logo = acm_logo()
+        if logo is not None:
+            logo_size = 1 * inch
+            canvas.drawImage(
+                logo,
+                logo_x,
+                height - 1.1 * inch,
+                width=logo_size,
+                height=logo_size,
+                preserveAspectRatio=True,
+                mask='auto'
             )
+            logo_width = logo_size
+
+        text_x = logo_x + logo_width + 15
+
+        canvas.setFont('Helvetica-Bold', 16)
+        canvas.setFillColor(colors.HexColor('#2c3e50'))
+        canvas.drawString(text_x, height - 0.6 * inch, "ASSOCIATION FOR COMPUTING MACHINERY")
 
-            logo_x = 50
-            logo_width = 0
+        canvas.setFont('Helvetica', 10)
+        canvas.drawString(text_x, height - 0.8 * inch, "COMSATS University Islamabad, Wah Chapter")
 
-            if os.path.isfile(logo_path):
-                logo = ImageReader(logo_path)
-                logo_size = 1 * inch
-                canvas.drawImage(
-                    logo,
-                    logo_x,
-                    height - 1.1 * inch,
-                    width=logo_size,
-                    height=logo_size,
-                    preserveAspectRatio=True,
-                    mask='auto'
-                )
-                logo_width = logo_size
+        canvas.setStrokeColor(colors.HexColor('#dcdcdc'))
+        canvas.line(0.5 * inch, height - 1.2 * inch, width - 0.5 * inch, height - 1.2 * inch)
 
-            text_x = logo_x + logo_width + 15
+        canvas.restoreState()
 
-            canvas.setFont('Helvetica-Bold', 16)
-            canvas.setFillColor(colors.HexColor('#2c3e50'))
-            canvas.drawString(text_x, height - 0.6 * inch, "ASSOCIATION FOR COMPUTING MACHINERY")
+    doc.build(elements, onFirstPage=add_header)
+    return buffer.getvalue()
 
-            canvas.setFont('Helvetica', 10)
-            canvas.drawString(text_x, height - 0.8 * inch, "COMSATS University Islamabad, Wah Chapter")
 
-            canvas.setStrokeColor(colors.HexColor('#dcdcdc'))
-            canvas.line(0.5 * inch, height - 1.2 * inch, width - 0.5 * inch, height - 1.2 * inch)
+class MeetingPDFView(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsLeadOrAdmin]
+
+    def get(self, request, pk, *args, **kwargs):
+        try:
+            meeting = Meeting.objects.get(pk=pk)
+        except Meeting.DoesNotExist:
+            return Response(
+                {"status": "error", "message": "Meeting not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        student = getattr(request.user, 'student', None)
+        club = student.club if student else None
+
+        # The document depends on the meeting, who asks for it (leads only see their club) and
+        # on the attendance and member data, whose versions are bumped whenever they change.
+        scope = f"{request.user.role}:{club or ''}"
+        version = f"{meeting.pk}:{scope}:{meeting_version(meeting.pk)}:{members_version()}"
+        etag = quote_etag(hashlib.md5(version.encode()).hexdigest())
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified['ETag'] = etag
+            return not_modified
+
+        cache_key = f"meeting-pdf:{version}"
+        pdf = cache.get(cache_key)
+        if pdf is None:
+            if request.user.role == 'LEAD' and student:
+                attendance = MeetingAttendance.objects.filter(
+                    meeting=meeting,
+                    user__student__club=club
+                ).select_related('user')
+            else:
+                attendance = MeetingAttendance.objects.filter(
+                    meeting=meeting
+                ).select_related('user')
 
-            canvas.restoreState()
+            club_name = None
+            if request.user.role != 'ADMIN' and student:
+                club_name = club.replace('_', ' ').title()
 
-        doc.build(elements, onFirstPage=add_header)
+            pdf = render_meeting_minutes(meeting, attendance, club_name)
+            cache.set(cache_key, pdf, MEETING_PDF_CACHE_TIMEOUT)
 
-        buffer.seek(0)
-        response = HttpResponse(buffer, content_type='application/pdf')
+        response = HttpResponse(pdf, content_type='application/pdf')
+        response['ETag'] = etag
         response['Content-Disposition'] = f'attachment; filename="acm_meeting_minutes_{meeting.date}.pdf"'
-        return response
\ No newline at end of file
+        return response
@@ -1,20 +1,33 @@
+from functools import partial
+from api.cache import CachedResponseMixin, bump_content_version, content_version
+from api.filters import ApplicationSearchFilter
 from api.models import RecruitmentSession, RecruitmentApplication, ApplicationStatus, Role
 from api.serializers.recruitment import (
     RecruitmentSessionSerializer,
     RecruitmentApplicationSubmissionSerializer,
     RecruitmentApplicationSerializer,
+    BulkApplicationStatusSerializer,
 )
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils.timezone import now
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet, ModelViewSet
+from api.pagination import RankedPagination
 from api.permissions import IsAdmin
+from api.renderers import XLSXRenderer, CSVRenderer, NDJSONRenderer
+import csv
+import json
+import tempfile
 from openpyxl import Workbook
-from django.http import HttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, FileResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from drf_spectacular.utils import (
     extend_schema,
@@ -27,6 +40,63 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 
 
+# Rows fetched per round-trip when streaming exports through a server-side cursor
+EXPORT_CHUNK_SIZE = 1000
+# Stats are dropped as soon as an application of the session changes; this only bounds stale edits elsewhere
+RECRUITMENT_STATS_CACHE_TIMEOUT = getattr(settings, "RECRUITMENT_STATS_CACHE_TIMEOUT", 60 * 60)
+
+EXPORT_HEADERS = [
+    "Application ID", "Status",
+    "Session", "Application Start", "Application End",
+    "Interview Start", "Interview End", "Result Date",
+    "First Name", "Last Name", "Email", "Phone",
+    "Registration No", "Program", "Current Semester",
+    "Skills", "Relevant Coursework",
+    "Preferred Role", "Secondary Role",
+    "Join Purpose", "Previous Experience",
+    "Weekly Availability", "LinkedIn",
+]
+
+
+class Echo:
+    """ File-like object that hands back what is written, used to stream csv.writer output. """
+    def write(self, value):
+        return value
+
+
+def export_row(app):
+    """ Flattens an application and its related records into a row matching EXPORT_HEADERS. """
+    session = app.recruitment_session
+    personal = getattr(app, "personal_info", None)
+    academic = getattr(app, "academic_info", None)
+    role = getattr(app, "role_preferences", None)
+
+    return [
+        app.id, app.status,
+        session.uni_session,
+        session.application_start,
+        session.application_end,
+        session.interview_start,
+        session.interview_end,
+        session.result_date,
+        personal.first_name if personal else "",
+        personal.last_name if personal else "",
+        personal.email if personal else "",
+        personal.phone_number if personal else "",
+        academic.reg_no if academic else "",
+        academic.program if academic else "",
+        academic.current_semester if academic else "",
+        ", ".join(academic.skills) if academic else "",
+        ", ".join(academic.relevant_coursework) if academic else "",
+        role.preferred_role if role else "",
+        role.secondary_role if role else "",
+        role.join_purpose if role else "",
+        role.previous_experience if role else "",
+        role.weekly_availability if role else "",
+        role.linkedin_profile if role else "",
+    ]
+
+
 # -------------
 # Admin Views
 # -------------
@@ -39,11 +109,36 @@ class RecruitmentSessionViewSet(ModelViewSet):
     serializer_class = RecruitmentSessionSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
 
+    @extend_schema(
+        request=None,
+        description=(
+            "Application counts of a session by status, program, semester and preferred role, "
+            "plus how often each skill is listed. Cached until an application of the session changes."
+        ),
+    )
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        # Looked up first, so unknown ids 404 instead of each leaving a version key behind
+        session = self.get_object()
+        key = f"recruitment-stats:{session.pk}:{content_version(f'applications-{session.pk}')}"
+        stats = cache.get(key)
+        if stats is None:
+            stats = {'session': session.uni_session, **session.application_stats()}
+            cache.set(key, stats, RECRUITMENT_STATS_CACHE_TIMEOUT)
+
+        return Response({
+            "status": "success",
+            "message": "Recruitment stats retrieved successfully",
+            "data": stats
+        }, status=status.HTTP_200_OK)
+
 
 class ApplicationReviewViewSet(ReadOnlyModelViewSet):
     """
     Admin view for reviewing applications.
-    Supports filtering by status and recruitment_session.
+    Supports exact filtering by status and recruitment_session, both served by
+    the (recruitment_session, status, id) and (status, id) indexes, and ranked
+    full-text search through `search`.
     """
     queryset = RecruitmentApplication.objects.select_related(
         "recruitment_session"
@@ -53,9 +148,9 @@ class ApplicationReviewViewSet(ReadOnlyModelViewSet):
     serializer_class = RecruitmentApplicationSubmissionSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
 
-    filter_backends = [SearchFilter, DjangoFilterBackend]
-    search_fields = ["status"]
+    filter_backends = [DjangoFilterBackend, ApplicationSearchFilter]
     filterset_fields = ["status", "recruitment_session"]
+    pagination_class = RankedPagination
 
 
 class ApplicationStatusUpdateViewSet(ModelViewSet):
@@ -66,6 +161,11 @@ class ApplicationStatusUpdateViewSet(ModelViewSet):
     serializer_class = RecruitmentApplicationSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
 
+    # The bulk transition selects applications with the same filters as the review list
+    filter_backends = ApplicationReviewViewSet.filter_backends
+    search_param = ApplicationSearchFilter.search_param
+    filterset_fields = ApplicationReviewViewSet.filterset_fields
+
     http_method_names = ['patch', 'get']
 
     @action(detail=True, methods=["patch"])
@@ -81,15 +181,78 @@ class ApplicationStatusUpdateViewSet(ModelViewSet):
         application.save()
         return Response({"status": "updated"})
 
+    @extend_schema(
+        request=BulkApplicationStatusSerializer,
+        parameters=[
+            OpenApiParameter(name="status", type=OpenApiTypes.STR, location=OpenApiParameter.QUERY, required=False,
+                             description="Only move applications currently in this status (when no ids are given)"),
+            OpenApiParameter(name="recruitment_session", type=OpenApiTypes.INT, location=OpenApiParameter.QUERY,
+                             required=False, description="Only move applications of this session (when no ids are given)"),
+            OpenApiParameter(name="search", type=OpenApiTypes.STR, location=OpenApiParameter.QUERY, required=False,
+                             description="Only move applications matching this search (when no ids are given)"),
+        ],
+        description=(
+            "Moves many applications to a new status with a single UPDATE. Applications are picked by "
+            "`ids` in the body or, without ids, by the review list's query filters. Each application is "
+            "reported as `updated`, `unchanged` (already in that status) or `not_found`."
+        ),
+    )
+    @action(detail=False, methods=["patch"], url_path="bulk-update-status")
+    def bulk_update_status(self, request):
+        serializer = BulkApplicationStatusSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({
+                "status": "error",
+                "message": serializer.errors,
+                "data": None
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        new_status = serializer.validated_data["status"]
+        ids = serializer.validated_data.get("ids")
+        if ids:
+            applications = RecruitmentApplication.objects.filter(id__in=ids)
+        elif any(request.query_params.get(param) for param in [self.search_param, *self.filterset_fields]):
+            applications = self.filter_queryset(self.get_queryset())
+        else:
+            return Response({
+                "status": "error",
+                "message": "Provide either ids or at least one filter.",
+                "data": None
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            # Lock the selected rows so the per-id results match what the UPDATE did
+            rows = list(applications.select_for_update().values_list("id", "status", "recruitment_session_id"))
+            current = {pk: old_status for pk, old_status, _ in rows}
+            to_update = [pk for pk, old_status in current.items() if old_status != new_status]
+            updated = RecruitmentApplication.objects.filter(id__in=to_update).update(status=new_status)
+            # update() sends no signals, so refresh the stats of every session touched here
+            for session_id in {session_id for _, old_status, session_id in rows if old_status != new_status}:
+                transaction.on_commit(partial(bump_content_version, f"applications-{session_id}"))
+
+        outcome = {pk: "unchanged" for pk in current}
+        outcome.update({pk: "updated" for pk in to_update})
+        results = [{"id": pk, "result": outcome.get(pk, "not_found")} for pk in (ids or sorted(current))]
+        return Response({
+            "status": "success",
+            "message": f"{updated} application(s) moved to {new_status}",
+            "data": {"updated": updated, "results": results}
+        }, status=status.HTTP_200_OK)
+
 
 # -----------------------------
 # Public Views
 # -----------------------------
 
-class ActiveRecruitmentSessionView(ReadOnlyModelViewSet):
+class ActiveRecruitmentSessionView(CachedResponseMixin, ReadOnlyModelViewSet):
     queryset = RecruitmentSession.objects.all()
     serializer_class = RecruitmentSessionSerializer
     permission_classes = [AllowAny]
+    response_cache_groups = ('recruitment-sessions',)
+
+    def get_response_cache_key(self, request):
+        # Which sessions are active changes with the date, not only with the data
+        return f"{super().get_response_cache_key(request)}:{now().date()}"
 
     def get_queryset(self):
         today = now().date()
@@ -139,14 +302,26 @@ class ApplicationSubmitView(ModelViewSet):
             required=False,
             enum=[r for r, _ in Role.choices],
         ),
+        OpenApiParameter(
+            name="format",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description="Export format (defaults to xlsx)",
+            required=False,
+            enum=["xlsx", "csv", "ndjson"],
+        ),
     ],
     responses={
         200: OpenApiTypes.BINARY,
     },
-    description="Export recruitment applications as an Excel file",
+    description=(
+        "Export recruitment applications as an Excel, CSV or NDJSON file. "
+        "CSV and NDJSON rows are streamed straight from the database as they are read."
+    ),
 )
-class RecruitmentApplicationsExcelView(APIView):
+class RecruitmentApplicationsExportView(APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
+    renderer_classes = [XLSXRenderer, CSVRenderer, NDJSONRenderer]
 
     def get(self, request):
         session_code = request.query_params.get("session")
@@ -190,62 +365,69 @@ class RecruitmentApplicationsExcelView(APIView):
                 role_preferences__preferred_role=preferred_role
             )
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Recruitment Applications"
-
-        headers = [
-            "Application ID", "Status",
-            "Session", "Application Start", "Application End",
-            "Interview Start", "Interview End", "Result Date",
-            "First Name", "Last Name", "Email", "Phone",
-            "Registration No", "Program", "Current Semester",
-            "Skills", "Relevant Coursework",
-            "Preferred Role", "Secondary Role",
-            "Join Purpose", "Previous Experience",
-            "Weekly Availability", "LinkedIn",
-        ]
-        ws.append(headers)
-
-        for app in applications:
-            session = app.recruitment_session
-            personal = getattr(app, "personal_info", None)
-            academic = getattr(app, "academic_info", None)
-            role = getattr(app, "role_preferences", None)
-
-            ws.append([
-                app.id, app.status,
-                session.uni_session,
-                session.application_start,
-                session.application_end,
-                session.interview_start,
-                session.interview_end,
-                session.result_date,
-                personal.first_name if personal else "",
-                personal.last_name if personal else "",
-                personal.email if personal else "",
-                personal.phone_number if personal else "",
-                academic.reg_no if academic else "",
-                academic.program if academic else "",
-                academic.current_semester if academic else "",
-                ", ".join(academic.skills) if academic else "",
-                ", ".join(academic.relevant_coursework) if academic else "",
-                role.preferred_role if role else "",
-                role.secondary_role if role else "",
-                role.join_purpose if role else "",
-                role.previous_experience if role else "",
-                role.weekly_availability if role else "",
-                role.linkedin_profile if role else "",
-            ])
-
-        response = HttpResponse(
-            content_type=(
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
-        )
-        response["Content-Disposition"] = (
-            'attachment; filename="recruitment_applications.xlsx"'
+        export_format = request.accepted_renderer.format
+        if export_format == "csv":
+            return self.csv_response(applications)
+        if export_format == "ndjson":
+            return self.ndjson_response(applications)
+        return self.excel_response(applications)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Errors raised by DRF (auth, permissions) are still rendered as JSON
+        if isinstance(response, Response):
+            request.accepted_renderer = JSONRenderer()
+            request.accepted_media_type = JSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def excel_response(self, applications):
+        # A write-only workbook flushes rows to a temp file as they are appended, and the
+        # queryset is read in chunks, so memory stays flat however many applications match.
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Recruitment Applications")
+        ws.append(EXPORT_HEADERS)
+
+        for app in applications.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            ws.append(export_row(app))
+
+        output = tempfile.TemporaryFile()
+        wb.save(output)
+        output.seek(0)
+
+        # FileResponse streams the finished file in blocks and closes it afterwards
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename="recruitment_applications.xlsx",
+            content_type=XLSXRenderer.media_type,
         )
 
-        wb.save(response)
-        return response
\ No newline at end of file
+    def csv_response(self, applications):
+        # csv.writer only needs an object with write(); returning the line lets each row be yielded
+        writer = csv.writer(Echo())
+
+        def rows():
+            yield writer.writerow(EXPORT_HEADERS)
+            for app in applications.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                yield writer.writerow(export_row(app))
+
+        response = StreamingHttpResponse(rows(), content_type=CSVRenderer.media_type)
+        response["Content-Disposition"] = 'attachment; filename="recruitment_applications.csv"'
+        return response
+
+    def ndjson_response(self, applications):
+        keys = [header.lower().replace(" ", "_") for header in EXPORT_HEADERS]
+
+        def lines():
+            for app in applications.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                yield json.dumps(dict(zip(keys, export_row(app))), cls=DjangoJSONEncoder) + "\n"
+
+        response = StreamingHttpResponse(lines(), content_type=NDJSONRenderer.media_type)
+        response["Content-Disposition"] = 'attachment; filename="recruitment_applications.ndjson"'
+        return response
+
+
+class RecruitmentApplicationsExcelView(RecruitmentApplicationsExportView):
+    """
+    Kept for existing clients of `recruitment/export/excel/`, always exports XLSX.
+    """
+    renderer_classes = [XLSXRenderer]
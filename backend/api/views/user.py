@@ -3,7 +3,9 @@ from rest_framework import generics, status
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from api.cache import CachedResponseMixin
 from api.models import Student
+from api.pagination import IdCursorPagination
 from api.permissions import IsLeadOrAdmin
 from api.serializers import StudentSerializer, StudentListSerializer, PublicStudentSerializer, \
     ProfileUpdateSerializer
@@ -11,24 +13,36 @@ from api.serializers import StudentSerializer, StudentListSerializer, PublicStud
 User = get_user_model()
 DEFAULT_PASSWORD = '12345'
 
+# Columns read by StudentListSerializer / PublicStudentSerializer; everything else is deferred
+STUDENT_LIST_FIELDS = (
+    'id', 'roll_no', 'club', 'title', 'profile_pic', 'profile_desc',
+    'user__id', 'user__first_name', 'user__last_name', 'user__email', 'user__role', 'user__username',
+    'user__phone_number',
+)
+PUBLIC_STUDENT_FIELDS = ('id', 'club', 'title', 'profile_pic', 'user__first_name', 'user__last_name')
+
 
 class StudentsListView(generics.ListAPIView):
     serializer_class = StudentListSerializer
     permission_classes = [IsLeadOrAdmin]
+    pagination_class = IdCursorPagination
 
     def get_queryset(self):
+        queryset = Student.objects.select_related('user').only(*STUDENT_LIST_FIELDS)
         if self.request.user.role == 'LEAD':
             club = self.request.user.student.club
-            return Student.objects.filter(club=club)
-        return Student.objects.all()
+            return queryset.filter(club=club)
+        return queryset
 
 
-class PublicStudentsListView(generics.ListAPIView):
+class PublicStudentsListView(CachedResponseMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = PublicStudentSerializer
+    pagination_class = IdCursorPagination
+    response_cache_groups = ('members',)
 
     def get_queryset(self):
-        return Student.objects.all()
+        return Student.objects.select_related('user').only(*PUBLIC_STUDENT_FIELDS)
 
 
 class StudentRUView(generics.RetrieveUpdateDestroyAPIView):
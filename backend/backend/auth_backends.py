@@ -1,19 +1,43 @@
+import re
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
 from django.contrib.auth.hashers import check_password
 from django.contrib.auth import get_user_model
+from api.serializers.user import ROLL_NO_REGEX
+
 
 class MultiFieldAuthBackend(ModelBackend):
+    """
+    Authenticates with a username, email or roll number. The identifier is
+    classified up front so the lookup hits a single indexed column instead of
+    an OR across three columns joined with Student.
+    """
     User = get_user_model()
 
-    def authenticate(self, request, username=None, password=None, **kwargs):
+    def lookup_field(self, identifier):
+        if '@' in identifier:
+            return 'email'
+        # Same format the StudentSerializer enforces, e.g. FA22-BCS-012
+        if re.match(ROLL_NO_REGEX, identifier):
+            return 'student__roll_no'
+        return 'username'
+
+    def get_by_identifier(self, identifier):
+        field = self.lookup_field(identifier)
         try:
-            user = self.User.objects.get(
-                Q(username=username) |
-                Q(email=username) |
-                Q(student__roll_no=username)
-            )
+            return self.User.objects.get(**{field: identifier})
         except self.User.DoesNotExist:
+            # Usernames may contain '@' or look like roll numbers, so fall back to them on a miss
+            if field == 'username':
+                return None
+            return self.User.objects.filter(username=identifier).first()
+        except self.User.MultipleObjectsReturned:
+            return None
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if not username or not password:
+            return None
+        user = self.get_by_identifier(username)
+        if user is None:
             return None
         if check_password(password, user.password):
             return user